@@ -1,5 +1,6 @@
 import sys
 import os
+import signal
 import subprocess
 import typer
 import shutil
@@ -85,6 +86,21 @@ def kill_process(pid: int):
         subprocess.run(["kill", "-9", str(pid)], check=True)
 
 
+def stop_process_group(proc: subprocess.Popen, timeout: float = 10.0):
+    """Terminate a child started with start_new_session=True and its descendants."""
+    if proc.poll() is not None:
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+    except ProcessLookupError:
+        pass  # Already gone
+
+
 def run_command(
     cmd: list[str], cwd: Path = None, check: bool = True, shell_on_windows: bool = False
 ):
@@ -134,6 +150,7 @@ def start(
         backend_cmd.append("--debug")
 
     typer.echo("  • Starting Backend...")
+    backend = None
     # On Windows, we need to handle the separate window/process carefully
     if IS_WINDOWS:
         subprocess.Popen(
@@ -142,9 +159,20 @@ def start(
             cwd=root,
         )
     else:
-        # Mac/Linux: run in background
-        subprocess.Popen(backend_cmd, cwd=root)
+        # Mac/Linux: run in background, in its own process group so the whole
+        # tree can be stopped when the dev server exits
+        backend = subprocess.Popen(backend_cmd, cwd=root, start_new_session=True)
+
+    try:
+        _run_frontend(root)
+    finally:
+        if backend is not None:
+            typer.echo("  • Stopping Backend...")
+            stop_process_group(backend)
+
 
+def _run_frontend(root: Path):
+    """Install frontend dependencies if needed and run the dev server."""
     # 2. Start Frontend
     typer.echo("  • Starting Frontend...")
     frontend_app_dir = root / "frontend"
@@ -10,7 +10,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
+from sqlalchemy import delete, update
 from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import StaticPool
 from sqlmodel import (
     Column,
     Field,
@@ -152,36 +154,51 @@ class MemoryConfigModel(SQLModel, table=True):
 # -----------------------------------------------------------------------------
 
 
+# Pass as db_path to keep the database in memory
+MEMORY_DB = ":memory:"
+
+
 class ChatDatabase:
     """Handles database operations for chat persistence using SQLModel."""
 
     def __init__(self, db_path: str = None):
-        if db_path is None:
-            # Use data directory from config if available, otherwise relative to project
-            try:
-                from suzent.config import DATA_DIR
-
-                self.db_path = DATA_DIR / "chats.db"
-            except ImportError:
-                self.db_path = Path(".suzent/chats.db")
+        if db_path == MEMORY_DB:
+            # In-memory database (tests, scratch use): one connection shared
+            # by all threads, otherwise each thread would see an empty DB
+            self.db_path = None
+            self.engine = create_engine(
+                "sqlite://",
+                echo=False,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
         else:
-            self.db_path = Path(db_path)
+            if db_path is None:
+                # Use data directory from config if available, otherwise relative to project
+                try:
+                    from suzent.config import DATA_DIR
+
+                    self.db_path = DATA_DIR / "chats.db"
+                except ImportError:
+                    self.db_path = Path(".suzent/chats.db")
+            else:
+                self.db_path = Path(db_path)
 
-        # Ensure parent directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure parent directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # If db_path is a directory (Docker mount issue), remove it and create file
-        if self.db_path.is_dir():
-            import shutil
+            # If db_path is a directory (Docker mount issue), remove it and create file
+            if self.db_path.is_dir():
+                import shutil
 
-            shutil.rmtree(self.db_path)
+                shutil.rmtree(self.db_path)
 
-        # Create engine with SQLite
-        self.engine = create_engine(
-            f"sqlite:///{self.db_path}",
-            echo=False,
-            connect_args={"check_same_thread": False},
-        )
+            # Create engine with SQLite
+            self.engine = create_engine(
+                f"sqlite:///{self.db_path}",
+                echo=False,
+                connect_args={"check_same_thread": False},
+            )
 
         # Create all tables
         SQLModel.metadata.create_all(self.engine)
@@ -203,10 +220,43 @@ class ChatDatabase:
         chat_id: str = None,
     ) -> str:
         """Create a new chat and return its ID."""
+        chat = self._new_chat(title, config, messages, agent_state, chat_id)
+        chat_id = chat.id
+
+        with self._session() as session:
+            session.add(chat)
+            session.commit()
+
+        return chat_id
+
+    def create_chats(self, chats: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several chats in a single transaction and return their IDs.
+
+        Each item takes the same keyword arguments as create_chat.
+        """
+        models = [self._new_chat(**chat) for chat in chats]
+        # Read IDs before commit expires the instances
+        chat_ids = [chat.id for chat in models]
+
+        with self._session() as session:
+            session.add_all(models)
+            session.commit()
+
+        return chat_ids
+
+    @staticmethod
+    def _new_chat(
+        title: str,
+        config: Dict[str, Any],
+        messages: List[Dict[str, Any]] = None,
+        agent_state: bytes = None,
+        chat_id: str = None,
+    ) -> ChatModel:
+        """Build a ChatModel with fresh timestamps."""
         now = datetime.now()
-        chat_id = chat_id or str(uuid.uuid4())
-        chat = ChatModel(
-            id=chat_id,
+        return ChatModel(
+            id=chat_id or str(uuid.uuid4()),
             title=title,
             created_at=now,
             updated_at=now,
@@ -215,12 +265,6 @@ class ChatDatabase:
             agent_state=agent_state,
         )
 
-        with self._session() as session:
-            session.add(chat)
-            session.commit()
-
-        return chat_id
-
     def get_chat(self, chat_id: str) -> Optional[ChatModel]:
         """Get a specific chat by ID."""
         with self._session() as session:
@@ -366,10 +410,8 @@ class ChatDatabase:
                 existing_plan.updated_at = now
                 session.add(existing_plan)
 
-                # Delete existing tasks
-                task_stmt = select(TaskModel).where(TaskModel.plan_id == plan_id)
-                for task in session.exec(task_stmt).all():
-                    session.delete(task)
+                # Delete existing tasks in one statement, without loading them
+                session.execute(delete(TaskModel).where(TaskModel.plan_id == plan_id))
             else:
                 # Create new plan
                 new_plan = PlanModel(
@@ -379,13 +421,13 @@ class ChatDatabase:
                     updated_at=now,
                 )
                 session.add(new_plan)
-                session.commit()
-                session.refresh(new_plan)
+                # Flush to get the ID; plan and tasks commit together below
+                session.flush()
                 plan_id = new_plan.id
 
             # Create tasks
-            for task_data in tasks:
-                task = TaskModel(
+            session.add_all(
+                TaskModel(
                     plan_id=plan_id,
                     number=task_data.get("number"),
                     description=task_data.get("description"),
@@ -395,7 +437,8 @@ class ChatDatabase:
                     created_at=now,
                     updated_at=now,
                 )
-                session.add(task)
+                for task_data in tasks
+            )
 
             session.commit()
             return plan_id
@@ -534,6 +577,37 @@ class ChatDatabase:
             session.commit()
             return True
 
+    def update_task_statuses(self, plan_id: int, statuses: Dict[int, str]) -> int:
+        """Set the status of several tasks of a plan, keyed by task number.
+
+        Only the affected task rows and the plan's updated_at are touched; the
+        plan's other tasks are left as they are. Returns the number of tasks
+        updated.
+        """
+        if not statuses:
+            return 0
+
+        now = datetime.now()
+        with self._session() as session:
+            task_stmt = select(TaskModel).where(
+                (TaskModel.plan_id == plan_id) & (TaskModel.number.in_(list(statuses)))
+            )
+            tasks = session.exec(task_stmt).all()
+
+            for task in tasks:
+                task.status = statuses[task.number]
+                task.updated_at = now
+                session.add(task)
+
+            if tasks:
+                session.execute(
+                    update(PlanModel)
+                    .where(PlanModel.id == plan_id)
+                    .values(updated_at=now)
+                )
+            session.commit()
+            return len(tasks)
+
     def update_task(
         self,
         task_id: int,
@@ -701,6 +775,11 @@ class ChatDatabase:
             servers = session.exec(statement).all()
             return servers
 
+    def get_mcp_server(self, name: str) -> Optional[MCPServerModel]:
+        """Get a single MCP server by name."""
+        with self._session() as session:
+            return session.get(MCPServerModel, name)
+
     def add_mcp_server(
         self,
         name: str,
@@ -24,7 +24,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 import lancedb
-from lancedb.index import FTS
+from lancedb.index import FTS, IvfPq
 from lancedb.pydantic import LanceModel, Vector
 
 from suzent.config import CONFIG
@@ -38,6 +38,16 @@ logger = get_logger(__name__)
 CHAT_MATCH_BONUS = 10
 USER_MATCH_BONUS = 5
 
+# Below this many archival rows a brute-force vector scan is fast enough;
+# above it, build an IVF-PQ index so semantic search stops scanning everything
+ANN_INDEX_MIN_ROWS = 10_000
+
+# Once indexed, probe this many IVF partitions per query and re-rank
+# limit * ANN_REFINE_FACTOR candidates on the full vectors, so recall and the
+# reported _distance stay close to exact search. Ignored on unindexed tables.
+ANN_NPROBES = 20
+ANN_REFINE_FACTOR = 10
+
 
 # --- Helper Functions ---
 
@@ -157,13 +167,19 @@ class LanceDBMemoryStore:
         self.db: Optional[lancedb.AsyncDatabase] = None
         self.archival_table = None
         self.blocks_table = None
+        self._index_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
-        """Initialize connection to LanceDB."""
+        """Initialize connection to LanceDB.
+
+        The vector index is checked in a background task so a large archive
+        does not hold up startup while the index is built.
+        """
         try:
             os.makedirs(os.path.dirname(os.path.abspath(self.uri)), exist_ok=True)
             self.db = await lancedb.connect_async(self.uri)
             await self._init_tables()
+            self._index_task = asyncio.create_task(self.ensure_ann_index())
             logger.info(f"LanceDB connection established at {self.uri}")
         except Exception as e:
             logger.error(f"Failed to connect to LanceDB: {e}")
@@ -218,10 +234,42 @@ class LanceDBMemoryStore:
             except Exception as e:
                 logger.warning(f"Could not validate embedding dimension: {e}")
 
+    async def ensure_ann_index(self) -> bool:
+        """
+        Build an IVF-PQ vector index once the archival table is large enough.
+
+        Rows added after the index is built are still searched (by scan) until
+        the next rebuild. Returns True if the table has a vector index.
+        """
+        try:
+            indices = await self.archival_table.list_indices()
+            if any("vector" in index.columns for index in indices):
+                return True
+
+            rows = await self.archival_table.count_rows()
+            if rows < ANN_INDEX_MIN_ROWS:
+                return False
+
+            await self.archival_table.create_index(
+                "vector",
+                config=IvfPq(
+                    distance_type="cosine",
+                    num_partitions=max(1, min(1024, rows // 256)),
+                    num_sub_vectors=max(1, self.embedding_dim // 16),
+                ),
+            )
+            logger.info(f"Created IVF-PQ index on archival_memories ({rows} rows)")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not create vector index: {e}")
+            return False
+
     async def close(self) -> None:
-        """Close connection (no-op for LanceDB async client)."""
+        """Close connection, abandoning any index build still in progress."""
         # LanceDB async client doesn't require explicit cleanup
-        pass
+        if self._index_task is not None and not self._index_task.done():
+            self._index_task.cancel()
+        self._index_task = None
 
     # --- Filter Building Helpers ---
 
@@ -451,12 +499,8 @@ class LanceDBMemoryStore:
             if min_importance > 0:
                 where += f" AND importance >= {min_importance}"
 
-            qb = await self.archival_table.search(
-                query_embedding, vector_column_name="vector"
-            )
-            results = await (
-                qb.distance_type("cosine").where(where).limit(limit).to_list()
-            )
+            qb = await self._vector_query(query_embedding)
+            results = await qb.where(where).limit(limit).to_list()
 
             return [
                 self._format_memory_result(r, similarity=1.0 - r["_distance"])
@@ -469,14 +513,23 @@ class LanceDBMemoryStore:
 
     # --- Hybrid Search Helpers ---
 
+    async def _vector_query(self, query_embedding: List[float]):
+        """Start a cosine vector query, refined when the ANN index is used."""
+        qb = await self.archival_table.search(
+            query_embedding, vector_column_name="vector"
+        )
+        return (
+            qb.distance_type("cosine")
+            .nprobes(ANN_NPROBES)
+            .refine_factor(ANN_REFINE_FACTOR)
+        )
+
     async def _perform_semantic_search_internal(
         self, query_embedding: List[float], where: str, limit: int
     ) -> List[Dict[str, Any]]:
         """Execute semantic search query."""
-        qb = await self.archival_table.search(
-            query_embedding, vector_column_name="vector"
-        )
-        return await qb.distance_type("cosine").where(where).limit(limit).to_list()
+        qb = await self._vector_query(query_embedding)
+        return await qb.where(where).limit(limit).to_list()
 
     async def _perform_fts_search(
         self, query_text: str, where: str, limit: int
@@ -27,6 +27,9 @@ class SkillManager:
         self.loader = SkillLoader(skills_dir)
         self.persistence_file = PROJECT_DIR / "config" / "skills.json"
 
+        # Rendered skills XML, rebuilt only after skills or their state change
+        self._skills_xml: Optional[str] = None
+
         # Initialize enabled state
         self.enabled_skills = set()
         self._load_enabled_state()
@@ -75,10 +78,12 @@ class SkillManager:
 
     def enable_skill(self, name: str):
         self.enabled_skills.add(name)
+        self._skills_xml = None
         self._save_enabled_state()
 
     def disable_skill(self, name: str):
         self.enabled_skills.discard(name)
+        self._skills_xml = None
         self._save_enabled_state()
 
     def toggle_skill(self, name: str) -> bool:
@@ -96,6 +101,7 @@ class SkillManager:
         # Re-verify enabled skills exist?
         available = {s.metadata.name for s in self.loader.list_skills()}
         self.enabled_skills = self.enabled_skills.intersection(available)
+        self._skills_xml = None
         self._save_enabled_state()
 
     def get_skill_descriptions(self) -> str:
@@ -117,6 +123,12 @@ class SkillManager:
         Generate skills XML for context injection (Layer 1).
         Adheres to agentskills.io standard.
         """
+        if self._skills_xml is None:
+            self._skills_xml = self._build_skills_xml()
+        return self._skills_xml
+
+    def _build_skills_xml(self) -> str:
+        """Render the enabled skills as XML."""
         skills = self.loader.list_skills()
         if not skills:
             return "<available_skills></available_skills>"
@@ -21,6 +21,8 @@ from smolagents.tools import Tool
 
 from suzent.logger import get_logger
 
+__tools__ = ("BashTool",)
+
 logger = get_logger(__name__)
 
 
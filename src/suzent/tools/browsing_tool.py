@@ -12,6 +12,8 @@ from starlette.websockets import WebSocket
 from smolagents.tools import Tool
 from suzent.logger import get_logger
 
+__tools__ = ("BrowsingTool",)
+
 logger = get_logger(__name__)
 
 
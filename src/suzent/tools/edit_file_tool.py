@@ -9,6 +9,8 @@ from smolagents.tools import Tool
 from suzent.logger import get_logger
 from suzent.tools.path_resolver import PathResolver
 
+__tools__ = ("EditFileTool",)
+
 logger = get_logger(__name__)
 
 
@@ -9,11 +9,100 @@ execution environments.
 import fnmatch
 import os
 import re
+import stat
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+# Maximum number of virtual paths memoized per resolver instance
+_RESOLVE_CACHE_SIZE = 512
+
+# WSL-style host mount (/mnt/c/...), mapped back to a drive letter
+_WSL_MOUNT_RE = re.compile(r"^/mnt/([a-zA-Z])/(.*)")
+
+# Regex flags for glob matching; Windows filesystems are case-insensitive
+_GLOB_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+def _glob_to_regex(pattern: str) -> "re.Pattern[str]":
+    """
+    Translate a Path.glob style pattern into a compiled regex.
+
+    Unlike fnmatch.translate, wildcards never cross a "/" and "**/" matches
+    any number of directories, so the regex can be matched against a full
+    "/"-separated path relative to the search root.
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:[^/]+/)*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif char == "?":
+            parts.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+                i += 1
+                continue
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return re.compile("".join(parts), _GLOB_FLAGS)
+
+
+def _inside(root_sep: str, path_str: str) -> Optional[str]:
+    """
+    Check whether a path string equals or lies below a root.
+
+    Args:
+        root_sep: Root path string including its trailing separator
+        path_str: Path string to check
+
+    Returns:
+        The remainder of path_str below the root ("" for the root itself),
+        or None if the path lies outside it
+    """
+    if path_str.startswith(root_sep):
+        return path_str[len(root_sep) :]
+    if path_str == root_sep[:-1]:
+        return ""
+    return None
+
+
+# Lexical resolution result: (normalized host path, trusted root it lies under
+# or None if unknown, validator applied when the path must be canonicalized)
+_Route = Tuple[Path, Optional[str], Callable[[Path], Path]]
+
+
+class _MountTrieNode:
+    """Node of the custom mount trie, keyed by virtual path segment."""
+
+    __slots__ = ("children", "mount_point", "host", "has_mount_below")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_MountTrieNode"] = {}
+        # Set when a mount point ends here
+        self.mount_point: Optional[str] = None
+        self.host: Optional[Path] = None
+        self.has_mount_below = False  # True if any proper descendant is a mount
+
 
 class PathResolver:
     """
@@ -63,13 +152,72 @@ class PathResolver:
         self.workspace_root = Path(workspace_root or CONFIG.workspace_root).resolve()
         self.custom_mounts: Dict[str, Path] = {}  # container_path -> host_path
 
+        # normalized virtual path -> (normalized host path, trusted root, validator)
+        self._resolve_cache: OrderedDict[str, _Route] = OrderedDict()
+
         # Parse custom volumes (supported in both modes for consistency)
         if custom_volumes:
             self._parse_custom_volumes(custom_volumes)
+        self._has_mounts = bool(self.custom_mounts)
+        # container_path -> host path string, for string-level joins
+        self._mount_host_strs: Dict[str, str] = {
+            container_path: str(host_path)
+            for container_path, host_path in self.custom_mounts.items()
+        }
+        self._mount_trie = self._build_mount_trie()
+        # Mounts are static after init; longest first to handle nesting correctly
+        self._sorted_mounts: Tuple[Tuple[str, Path], ...] = tuple(
+            sorted(self.custom_mounts.items(), key=lambda x: len(x[0]), reverse=True)
+        )
+        self._match_mount = self._build_mount_matcher()
 
         # Ensure directories exist
         self._ensure_directories()
 
+        # Canonicalize the trusted roots once; per-call checks compare against these
+        self._persistence_root = (
+            self.sandbox_data_path / "sessions" / self.chat_id
+        ).resolve()
+        self._shared_root = (self.sandbox_data_path / "shared").resolve()
+        self._allowed_roots: Tuple[Path, ...] = (
+            self._persistence_root,
+            self._shared_root,
+            *self.custom_mounts.values(),
+        )
+
+        # String forms of the roots, used for syscall-free prefix checks
+        self._persistence_root_str = str(self._persistence_root)
+        self._shared_root_str = str(self._shared_root)
+        # (virtual prefix, prefix with trailing slash, host root, subdirectory)
+        # per standard root. /uploads is routed through the persistence root
+        # so the symlink walk also inspects the "uploads" component itself.
+        self._standard_roots: Tuple[Tuple[str, str, str, str], ...] = (
+            ("/persistence", "/persistence/", self._persistence_root_str, ""),
+            ("/shared", "/shared/", self._shared_root_str, ""),
+            ("/uploads", "/uploads/", self._persistence_root_str, "uploads"),
+        )
+        # (root, root + separator) pairs for lexical containment checks
+        self._containing_root_strs: Tuple[Tuple[str, str], ...] = tuple(
+            (str(root), str(root).rstrip(os.sep) + os.sep)
+            for root in (self.workspace_root, *self._allowed_roots)
+        )
+        # Case-normalized root + separator strings for boundary checks
+        self._allowed_prefixes = self._root_prefixes(self._allowed_roots)
+        self._workspace_prefixes = self._root_prefixes(
+            (self.workspace_root, *self._allowed_roots)
+        )
+
+        # Reverse index of host roots to virtual prefixes for host -> virtual
+        # lookups. Longest virtual prefix first so the most specific mount wins.
+        self._reverse_roots: List[Tuple[str, str]] = sorted(
+            (
+                (str(h_path).rstrip(os.sep) + os.sep, v_path)
+                for v_path, h_path in self.get_virtual_roots()
+            ),
+            key=lambda item: len(item[1]),
+            reverse=True,
+        )
+
     @staticmethod
     def parse_volume_string(vol: str) -> Optional[Tuple[str, str]]:
         """
@@ -100,9 +248,8 @@ class PathResolver:
             return path
 
         path = path.replace("\\", "/")
-        if ":" in path:
-            drive, rest = path.split(":", 1)
-            return f"/mnt/{drive.lower()}{rest}"
+        if len(path) >= 2 and path[1] == ":" and path[0].isalpha():
+            return f"/mnt/{path[0].lower()}{path[2:]}"
         return path
 
     @staticmethod
@@ -125,7 +272,7 @@ class PathResolver:
 
                 # Handle WSL-style mounts (/mnt/c/...) -> drive letter
                 if host_part.startswith("/mnt/"):
-                    match = re.match(r"^/mnt/([a-zA-Z])/(.*)", host_part)
+                    match = _WSL_MOUNT_RE.match(host_part)
                     if match:
                         drive = match.group(1).upper()
                         rest = match.group(2)
@@ -146,15 +293,86 @@ class PathResolver:
             except Exception as e:
                 logger.warning(f"Failed to parse custom volume '{vol}': {e}")
 
+    def _build_mount_trie(self) -> _MountTrieNode:
+        """Index custom mounts by virtual path segment."""
+        root = _MountTrieNode()
+        for container_path, host_path in self.custom_mounts.items():
+            node = root
+            for segment in container_path.split("/"):
+                if not segment:
+                    continue
+                node.has_mount_below = True
+                node = node.children.setdefault(segment, _MountTrieNode())
+            node.mount_point = container_path
+            node.host = host_path
+        return root
+
+    def _build_mount_matcher(self) -> Callable[[str], Optional[Tuple[str, str]]]:
+        """
+        Build a mount point matcher specialized for the configured mounts.
+
+        Returns:
+            Function mapping a virtual path to (longest matching mount point,
+            path relative to it), or None if no mount contains it
+        """
+        if not self._has_mounts:
+            return lambda virtual_path: None
+
+        if len(self.custom_mounts) == 1:
+            (mount_point,) = self.custom_mounts
+            mount_prefix = f"{mount_point}/"
+
+            def match_single(virtual_path: str) -> Optional[Tuple[str, str]]:
+                if virtual_path == mount_point or virtual_path.startswith(mount_prefix):
+                    return mount_point, virtual_path[len(mount_point) :].lstrip("/")
+                return None
+
+            return match_single
+
+        trie = self._mount_trie
+
+        def match_trie(virtual_path: str) -> Optional[Tuple[str, str]]:
+            # Walk segment by segment, remembering the deepest mount passed
+            if not virtual_path.startswith("/"):
+                return None
+            # Most lookups (/persistence, /shared, ...) miss on the first
+            # segment, which a single dict probe answers without splitting
+            first_end = virtual_path.find("/", 1)
+            first = virtual_path[1:first_end] if first_end != -1 else virtual_path[1:]
+            if first not in trie.children:
+                return None
+            segments = virtual_path.split("/")
+            node = trie
+            best = None
+            for index, segment in enumerate(segments):
+                if not segment:
+                    continue
+                node = node.children.get(segment)
+                if node is None:
+                    break
+                if node.mount_point is not None:
+                    best = (node.mount_point, index + 1)
+            if best is None:
+                return None
+            mount_point, end = best
+            return mount_point, "/".join(segments[end:]).lstrip("/")
+
+        return match_trie
+
     def _ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
+        uploads_dir = self.sandbox_data_path / "sessions" / self.chat_id / "uploads"
+        shared_dir = self.sandbox_data_path / "shared"
+        # Resolvers are built per request and the directories usually exist
+        # already; two stats are cheaper than two mkdir(parents=True) calls.
+        # Checked every time, since the sandbox routes can delete them.
+        if os.path.isdir(uploads_dir) and os.path.isdir(shared_dir):
+            return
 
         try:
             # Always use the consistent sandbox-style structure
-            (self.sandbox_data_path / "sessions" / self.chat_id).mkdir(
-                parents=True, exist_ok=True
-            )
-            (self.sandbox_data_path / "shared").mkdir(parents=True, exist_ok=True)
+            uploads_dir.mkdir(parents=True, exist_ok=True)
+            shared_dir.mkdir(parents=True, exist_ok=True)
 
             # In legacy mode, we might still want to ensure uploads path exists if used,
             # but for unification we prefer the sandbox structure.
@@ -184,41 +402,129 @@ class PathResolver:
         Raises:
             ValueError: If path traversal is detected or path is not allowed
         """
-        # Normalize path separators
-        virtual_path = virtual_path.replace("\\", "/").strip()
+        # Normalize path separators; most inputs already use "/"
+        if "\\" in virtual_path:
+            virtual_path = virtual_path.replace("\\", "/")
+        virtual_path = virtual_path.strip()
+
+        return self._resolve_fast(virtual_path)
+
+    def resolve_many(self, virtual_paths: List[str]) -> List[Path]:
+        """
+        Resolve several virtual paths, resolving each distinct path only once.
+
+        Args:
+            virtual_paths: Paths as specified by the user/agent
+
+        Returns:
+            Resolved host paths in the same order as the input
+
+        Raises:
+            ValueError: If any path is traversal or not allowed
+        """
+        # Bind per-call lookups to locals once for the whole batch
+        resolve_fast = self._resolve_fast
+        resolved: Dict[str, Path] = {}
+        results = []
+        for path in virtual_paths:
+            if "\\" in path:
+                path = path.replace("\\", "/")
+            path = path.strip()
+            host_path = resolved.get(path)
+            if host_path is None:
+                host_path = resolved[path] = resolve_fast(path)
+            results.append(host_path)
+        return results
+
+    def _resolve_fast(self, virtual_path: str) -> Path:
+        """
+        Resolve an already normalized virtual path.
+
+        Skips the separator and whitespace normalization done by resolve(), so
+        callers must pass "/"-separated, stripped paths.
+        """
+        cached = self._resolve_cache.get(virtual_path)
+        if cached is None:
+            cached = self._route_path(virtual_path)
+            self._resolve_cache[virtual_path] = cached
+            if len(self._resolve_cache) > _RESOLVE_CACHE_SIZE:
+                self._resolve_cache.popitem(last=False)
+        else:
+            self._resolve_cache.move_to_end(virtual_path)
+
+        # Symlinks are checked on every call rather than cached: sandboxed code
+        # can swap a previously resolved file for a link pointing elsewhere.
+        target, root, validate = cached
+        if root is None:
+            return validate(target.resolve())
+        return self._reject_symlinks(root, target, validate)
+
+    @staticmethod
+    def _reject_symlinks(
+        root: str, target: Path, validate: Callable[[Path], Path]
+    ) -> Path:
+        """
+        Check the components of target below its trusted root for symlinks.
+
+        Each existing component is inspected with os.lstat, so links are seen
+        before anything follows them. A path without links is already known
+        to be inside root and is returned as is. A link is only honoured if
+        the fully resolved path still passes validate.
 
-        return self._resolve_path(virtual_path)
+        Args:
+            root: Canonical root that target lexically lies under
+            target: Normalized host path
+            validate: Boundary check for the canonicalized path
+
+        Returns:
+            The host path to use
+
+        Raises:
+            ValueError: If a symlink leads outside the allowed directories
+        """
+        target_str = str(target)
+        end = len(root.rstrip(os.sep))
+        if len(target_str) <= end:
+            return target
+
+        # Check each prefix of target_str that ends at a separator, then the
+        # whole path, slicing instead of splitting and re-joining components
+        while end != -1:
+            end = target_str.find(os.sep, end + 1)
+            current = target_str if end == -1 else target_str[:end]
+            try:
+                mode = os.lstat(current).st_mode
+            except OSError:
+                # Nothing exists below this point, so there is nothing to follow
+                return target
+            if stat.S_ISLNK(mode):
+                return validate(target.resolve())
+        return target
+
+    def _route_path(self, virtual_path: str) -> _Route:
+        """
+        Map a virtual path to its normalized host path and boundary checks.
 
-    def _resolve_path(self, virtual_path: str) -> Path:
-        """Resolve path using unified logic (custom mounts, persistence, shared)."""
+        This is the purely lexical part of resolution, so its result can be
+        memoized per virtual path.
+        """
         # 1. Check custom mounts first (works in both sandbox and host modes)
-        # Check for longest matching prefix to handle nested mounts correctly
-        best_match = None
-        best_match_len = 0
-
-        for mount_point, host_path in self.custom_mounts.items():
-            # Check exact match or prefix match with /
-            if virtual_path == mount_point or virtual_path.startswith(
-                f"{mount_point}/"
-            ):
-                if len(mount_point) > best_match_len:
-                    best_match = mount_point
-                    best_match_len = len(mount_point)
-
-        if best_match:
-            rel_path = virtual_path[len(best_match) :].lstrip("/")
+        # The matcher returns the longest matching mount point, if any
+        mount_match = self._match_mount(virtual_path)
+        if mount_match:
+            best_match, rel_path = mount_match
             host_root = self.custom_mounts[best_match]
-            resolved = (
-                (host_root / rel_path).resolve() if rel_path else host_root.resolve()
-            )
-            # Validate ensuring it's still inside that volume
-            try:
-                resolved.relative_to(host_root)
-                return resolved
-            except ValueError:
+            host_root_str = self._mount_host_strs[best_match]
+            target = self._join_under(host_root_str, rel_path)
+            if target is None:
                 raise ValueError(
-                    f"Path traversal detected in custom volume: {resolved}"
+                    f"Path traversal detected in custom volume: {virtual_path}"
                 )
+            return (
+                target,
+                host_root_str,
+                lambda resolved: self._validate_within_mount(resolved, host_root),
+            )
 
         # 2. Branch based on sandbox mode for absolute host paths
         if not self.sandbox_enabled:
@@ -229,52 +535,88 @@ class PathResolver:
                 for prefix in ["/persistence", "/shared", "/uploads", "/mnt"]
             )
             if is_windows_absolute or is_unix_absolute:
-                resolved = Path(virtual_path).resolve()
-                return self._validate_within_workspace(resolved)
+                target = Path(os.path.normpath(virtual_path))
+                return (
+                    target,
+                    self._containing_root(target),
+                    self._validate_within_workspace,
+                )
 
         # 3. Resolve virtual paths (same logic for both sandbox and host modes)
-        resolved = self._resolve_virtual_path(virtual_path)
-
         # Security check: ensure resolved path is within allowed directories
-        self._validate_path(resolved)
-        return resolved
+        root, rel_path = self._resolve_virtual_path(virtual_path)
+        target = self._join_under(root, rel_path)
+        if target is None:
+            raise ValueError(
+                f"Path traversal detected: {virtual_path} is outside allowed directories"
+            )
+        return target, root, self._validate_path
+
+    def _containing_root(self, path: Path) -> Optional[str]:
+        """Return the workspace or allowed root that path lexically lies under."""
+        path_str = str(path)
+        best = None
+        for root_str, root_sep in self._containing_root_strs:
+            if _inside(root_sep, path_str) is not None:
+                if best is None or len(root_str) > len(best):
+                    best = root_str
+        return best
 
-    def _resolve_virtual_path(self, path: str) -> Path:
+    @staticmethod
+    def _join_under(root_str: str, rel_path: str) -> Optional[Path]:
+        """
+        Lexically join a relative path onto a root without touching the disk.
+
+        Returns:
+            The normalized path, or None if ".." segments escape the root
+        """
+        if not rel_path:
+            return Path(root_str)
+        joined = os.path.normpath(os.path.join(root_str, rel_path))
+        if _inside(root_str.rstrip(os.sep) + os.sep, joined) is not None:
+            return Path(joined)
+        return None
+
+    def _resolve_virtual_path(self, path: str) -> Tuple[str, str]:
         """
-        Resolve virtual paths like /persistence, /shared, /uploads.
+        Select the host root for virtual paths like /persistence, /shared, /uploads.
         Used by both sandbox and host modes.
 
         Args:
-            path: Virtual path to resolve
+            path: Virtual path to map
 
         Returns:
-            Resolved Path on host filesystem
-        """
-        if path.startswith("/persistence/") or path == "/persistence":
-            rel_path = path[len("/persistence") :].lstrip("/")
-            base = self.sandbox_data_path / "sessions" / self.chat_id
-            return (base / rel_path).resolve() if rel_path else base.resolve()
-
-        if path.startswith("/shared/") or path == "/shared":
-            rel_path = path[len("/shared") :].lstrip("/")
-            base = self.sandbox_data_path / "shared"
-            return (base / rel_path).resolve() if rel_path else base.resolve()
-
-        if path.startswith("/uploads/") or path == "/uploads":
-            rel_path = path[len("/uploads") :].lstrip("/")
-            base = self.sandbox_data_path / "sessions" / self.chat_id / "uploads"
-            base.mkdir(parents=True, exist_ok=True)
-            return (base / rel_path).resolve() if rel_path else base.resolve()
-
-        if path.startswith("/"):
-            # Absolute paths default to /persistence if no other match
-            rel_path = path.lstrip("/")
-            base = self.sandbox_data_path / "sessions" / self.chat_id
-            return (base / rel_path).resolve()
-
-        # Relative paths are relative to /persistence
-        base = self.sandbox_data_path / "sessions" / self.chat_id
-        return (base / path).resolve()
+            Tuple of (canonical host root, path relative to that root)
+        """
+        for prefix, prefix_slash, root_str, subdir in self._standard_roots:
+            if path == prefix or path.startswith(prefix_slash):
+                rel_path = path[len(prefix) :].lstrip("/")
+                if subdir:
+                    rel_path = f"{subdir}/{rel_path}" if rel_path else subdir
+                return root_str, rel_path
+
+        # Absolute paths default to /persistence if no other match, and
+        # relative paths are relative to /persistence
+        return self._persistence_root_str, path.lstrip("/")
+
+    @staticmethod
+    def _root_prefixes(roots) -> Tuple[str, ...]:
+        """Build case-normalized root + separator strings for prefix checks."""
+        return tuple(
+            os.path.normcase(str(root)).rstrip(os.sep) + os.sep for root in roots
+        )
+
+    @staticmethod
+    def _within_prefixes(resolved: Path, prefixes: Tuple[str, ...]) -> bool:
+        """Check whether resolved equals or lies below any of the given roots."""
+        resolved_str = os.path.normcase(str(resolved))
+        return any(_inside(root_sep, resolved_str) is not None for root_sep in prefixes)
+
+    def _validate_within_mount(self, resolved: Path, host_root: Path) -> Path:
+        """Ensure a path reached through a custom volume stays inside it."""
+        if not self._within_prefixes(resolved, self._root_prefixes((host_root,))):
+            raise ValueError(f"Path traversal detected in custom volume: {resolved}")
+        return resolved
 
     def _validate_within_workspace(self, resolved: Path) -> Path:
         """
@@ -291,53 +633,20 @@ class PathResolver:
         Raises:
             ValueError: If path is outside all allowed directories
         """
-        # Check if within workspace
-        try:
-            resolved.relative_to(self.workspace_root)
+        # Check if within workspace, sandbox data directories or any custom volume
+        if self._within_prefixes(resolved, self._workspace_prefixes):
             return resolved
-        except ValueError:
-            pass
-
-        # Check if within sandbox data directories (same validation as sandbox mode)
-        allowed_sandbox_roots = [
-            self.sandbox_data_path / "sessions" / self.chat_id,
-            self.sandbox_data_path / "shared",
-        ]
-        for root in allowed_sandbox_roots:
-            try:
-                resolved.relative_to(root.resolve())
-                return resolved
-            except ValueError:
-                continue
-
-        # Check if within any custom volume host path
-        for host_path in self.custom_mounts.values():
-            try:
-                resolved.relative_to(host_path.resolve())
-                return resolved  # Within custom volume
-            except ValueError:
-                continue
 
         raise ValueError(
             f"Path '{resolved}' is outside workspace, sandbox-data, and custom volumes. "
             f"Workspace: {self.workspace_root}, Sandbox: {self.sandbox_data_path}"
         )
 
-    def _validate_path(self, resolved: Path) -> None:
+    def _validate_path(self, resolved: Path) -> Path:
         """Validate that path is within allowed directories."""
         # Allowed roots include standard dirs AND all custom volume host paths
-        allowed_roots = [
-            self.sandbox_data_path / "sessions" / self.chat_id,
-            self.sandbox_data_path / "shared",
-        ]
-        allowed_roots.extend(self.custom_mounts.values())
-
-        for root in allowed_roots:
-            try:
-                resolved.relative_to(root.resolve())
-                return  # Path is valid
-            except ValueError:
-                continue
+        if self._within_prefixes(resolved, self._allowed_prefixes):
+            return resolved  # Path is valid
 
         raise ValueError(
             f"Path traversal detected: {resolved} is outside allowed directories"
@@ -353,11 +662,7 @@ class PathResolver:
         Returns:
             True if path is allowed, False otherwise
         """
-        try:
-            self._validate_path(path.resolve())
-            return True
-        except ValueError:
-            return False
+        return self._within_prefixes(path.resolve(), self._allowed_prefixes)
 
     def get_virtual_roots(self) -> List[Tuple[str, Path]]:
         """
@@ -367,34 +672,34 @@ class PathResolver:
             List of (virtual_path, host_path) tuples.
             e.g. [("/persistence", D:/.../sessions/123), ("/mnt/skills", D:/skills), ...]
         """
-        roots = []
-
-        # 1. Standard Roots
-        roots.append(
-            ("/persistence", self.sandbox_data_path / "sessions" / self.chat_id)
-        )
-        roots.append(("/shared", self.sandbox_data_path / "shared"))
-
-        # 2. Custom Mounts
-        # Sort by length descending to handle nested mounts correctly
-        sorted_mounts = sorted(
-            self.custom_mounts.items(), key=lambda x: len(x[0]), reverse=True
-        )
-        for v_path, h_path in sorted_mounts:
-            roots.append((v_path, h_path))
-
-        return roots
+        return [
+            ("/persistence", self._persistence_root),
+            ("/shared", self._shared_root),
+            *self._sorted_mounts,
+        ]
 
     def is_shadowed(self, virtual_path: str) -> bool:
         """
         Check if a file at this virtual path would be hidden by a mount.
 
-        Note: This is a stub implementation that returns False.
-        Complex mount shadowing detection is not yet implemented.
+        A path is shadowed when a custom mount sits exactly at it or at any
+        path below it, so listing its host directory would not show what the
+        sandbox sees there.
+
+        Args:
+            virtual_path: Virtual path to check
+
+        Returns:
+            True if a mount overlays the path or part of its contents
         """
-        # TODO: Implement robust shadowing check if complex nesting is needed.
-        # For now, strict mount lists in get_virtual_roots + standard resolution is safe.
-        return False
+        node = self._mount_trie
+        for segment in virtual_path.replace("\\", "/").split("/"):
+            if not segment:
+                continue
+            node = node.children.get(segment)
+            if node is None:
+                return False
+        return node.host is not None or node.has_mount_below
 
     def to_virtual_path(self, host_path: Path) -> Optional[str]:
         """
@@ -406,51 +711,88 @@ class PathResolver:
         Returns:
             Virtual path string, or None if path is not in a known mount
         """
-        host_path = host_path.resolve()
+        return self._lookup_virtual_path(str(host_path.resolve()), self._reverse_roots)
 
-        # 1. Check custom mounts (reverse lookup)
-        # Prioritize longest match to handle nesting correctly
-        # e.g. /mnt/data vs /mnt/data/nested
+    @staticmethod
+    def _lookup_virtual_path(
+        host_path: str, reverse_index: List[Tuple[str, str]]
+    ) -> Optional[str]:
+        """
+        Map a host path string to a virtual path using a reverse root index.
 
-        # Invert map: host_path -> virtual_path (careful of duplicates?)
-        # Better: iterate and find best match.
+        Args:
+            host_path: Host path as a string
+            reverse_index: (host_root + separator, virtual_prefix) pairs, most
+                specific first
 
-        best_candidate = None
-        best_candidate_len = 0
+        Returns:
+            Virtual path string, or None if no root contains the path
+        """
+        for root_sep, v_prefix in reverse_index:
+            rel = _inside(root_sep, host_path)
+            if rel is None:
+                continue
+            if not rel:
+                return v_prefix
+            return f"{v_prefix}/{rel.replace(os.sep, '/')}"
+        return None
 
-        # Check all potential parents
-        potential_parents = [
-            (path, v_path) for v_path, path in self.custom_mounts.items()
-        ]
+    @staticmethod
+    def _scan_glob(root: Path, pattern: str) -> List[Path]:
+        """
+        Match a relative glob pattern below root using os.scandir.
 
-        # Add standard roots
-        potential_parents.append(
-            (
-                (self.sandbox_data_path / "sessions" / self.chat_id).resolve(),
-                "/persistence",
-            )
-        )
-        potential_parents.append(
-            ((self.sandbox_data_path / "shared").resolve(), "/shared")
-        )
+        Symlinked directories are not descended into, and the walk stops at
+        the pattern's depth unless it contains "**". A trailing "/" or "**"
+        restricts matches to directories, as Path.glob does.
+
+        Args:
+            root: Directory to search
+            pattern: Relative glob pattern with "/" separators
+
+        Returns:
+            Matching paths
+        """
+        pattern = pattern.lstrip("/")
+        while pattern.startswith("./"):
+            pattern = pattern[2:]
+        # As with Path.glob, a trailing "/" only matches directories
+        dirs_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        matches = []
+        if pattern == "**" or pattern.endswith("/**"):
+            # A trailing "**" matches the directory it is attached to and
+            # every directory below it, but no files
+            dirs_only = True
+            base = pattern[:-3]
+            if base:
+                regex = re.compile(
+                    _glob_to_regex(base).pattern + "(?:/.*)?", _GLOB_FLAGS
+                )
+            else:
+                regex = re.compile(".+")
+                matches.append(root)
+        else:
+            regex = _glob_to_regex(pattern)
+        max_depth = None if "**" in pattern else pattern.count("/") + 1
 
-        for root_path, v_prefix in potential_parents:
+        pending = [(str(root), "", 1)]
+        while pending:
+            directory, prefix, depth = pending.pop()
             try:
-                # check if host_path is relative to this root
-                if host_path == root_path or root_path in host_path.parents:
-                    rel = host_path.relative_to(root_path)
-                    v_path = f"{v_prefix}/{rel}".replace("\\", "/").rstrip("/.")
-                    if v_path.endswith("/."):
-                        v_path = v_path[:-2]
-
-                    # Store the one with the longest prefix (most specific mount)
-                    if len(v_prefix) > best_candidate_len:
-                        best_candidate = v_path
-                        best_candidate_len = len(v_prefix)
-            except ValueError:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        rel = prefix + entry.name
+                        if regex.fullmatch(rel) and (not dirs_only or entry.is_dir()):
+                            matches.append(Path(entry.path))
+                        if (max_depth is None or depth < max_depth) and entry.is_dir(
+                            follow_symlinks=False
+                        ):
+                            pending.append((entry.path, rel + "/", depth + 1))
+            except OSError:
                 continue
-
-        return best_candidate
+        return matches
 
     def find_files(
         self, pattern: str, search_path: Optional[str] = "/"
@@ -460,6 +802,7 @@ class PathResolver:
         """
         results = []
         seen_virtual_paths = set()
+        seen_matches = set()
 
         # Determine roots to search
         search_roots = []
@@ -522,21 +865,26 @@ class PathResolver:
                 continue
 
             # Run glob
-            try:
-                matches = list(h_root.glob(local_pattern))
-            except Exception:
-                continue
+            matches = self._scan_glob(h_root, local_pattern)
 
             for match in matches:
+                match_str = str(match)
+                if match_str in seen_matches:
+                    continue
+                seen_matches.add(match_str)
+
                 if not self.is_path_allowed(match):
                     continue
 
-                v_path = self.to_virtual_path(match)
+                v_path = self._lookup_virtual_path(match_str, self._reverse_roots)
+                if not v_path:
+                    v_path = self.to_virtual_path(match)
 
                 # Fallback path construction
-                if not v_path and v_root_prefix and h_root in match.parents:
-                    rel = match.relative_to(h_root)
-                    v_path = f"{v_root_prefix}/{rel}".replace("\\", "/")
+                if not v_path and v_root_prefix:
+                    rel = _inside(str(h_root).rstrip(os.sep) + os.sep, match_str)
+                    if rel:
+                        v_path = f"{v_root_prefix}/{rel}".replace("\\", "/")
 
                 if not v_path:
                     v_path = match.name
@@ -5,22 +5,27 @@ The tool is inspired by the smolagents style, providing a single class to intera
 with the plan. It supports creating a plan, checking its status, and updating steps.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from smolagents.tools import Tool
 
 from suzent.logger import get_logger
-from suzent.plan import (
-    Plan,
-    Phase,
-    read_plan_from_database,
-    read_plan_by_id,
-    write_plan_to_database,
-)
-from suzent.database import get_database
+
+if TYPE_CHECKING:
+    from suzent.plan import Plan, Phase
+
+# suzent.plan and suzent.database pull in SQLModel and the engine setup, so
+# they are imported on first use rather than when the tool registry scans
+# this module.
+
+__tools__ = ("PlanningTool",)
 
 logger = get_logger(__name__)
 
+# Supported actions, in the order they are listed to the model
+_VALID_ACTIONS = ("update", "advance")
+_VALID_ACTIONS_STR = ", ".join(_VALID_ACTIONS)
+
 
 class PlanningTool(Tool):
     """
@@ -46,6 +51,8 @@ class PlanningTool(Tool):
             and not self._migrated_temp_plan
         ):
             try:
+                from suzent.database import get_database
+
                 db = get_database()
                 migrated = db.reassign_plan_chat("planning_session_temp", chat_id)
                 if migrated:
@@ -60,7 +67,7 @@ class PlanningTool(Tool):
         "action": {
             "type": "string",
             "description": "The operation to perform.",
-            "enum": ["update", "advance"],
+            "enum": list(_VALID_ACTIONS),
         },
         "goal": {
             "type": "string",
@@ -98,20 +105,15 @@ class PlanningTool(Tool):
         self,
         action: str,
         goal: Optional[str] = None,
-        phases: Optional[list[Phase]] = None,
+        phases: Optional[list["Phase"]] = None,
         current_phase_id: Optional[int] = None,
         next_phase_id: Optional[int] = None,
         chat_id: Optional[str] = None,
     ) -> str:
         """Manages a project plan."""
-        action_map = {
-            "update": self._update_plan,
-            "advance": self._advance_plan,
-        }
-
-        if action not in action_map:
+        if action not in _VALID_ACTIONS:
             return self._format_error(
-                "Invalid action", f"Must be one of: {', '.join(action_map.keys())}"
+                "Invalid action", f"Must be one of: {_VALID_ACTIONS_STR}"
             )
 
         # Resolve chat_id (context takes priority)
@@ -129,13 +131,10 @@ class PlanningTool(Tool):
         if validation_error:
             return validation_error
 
-        # Prepare arguments for the respective methods
-        args = {
-            "update": (chat_id, goal, phases),
-            "advance": (chat_id, current_phase_id, next_phase_id),
-        }
-
-        return action_map[action](*args[action])
+        # Dispatch directly; only the chosen handler's arguments are passed
+        if action == "update":
+            return self._update_plan(chat_id, goal, phases)
+        return self._advance_plan(chat_id, current_phase_id, next_phase_id)
 
     def _resolve_chat_id(self, provided_chat_id: Optional[str]) -> Optional[str]:
         """Resolve the chat_id, prioritizing context over provided value."""
@@ -176,8 +175,10 @@ class PlanningTool(Tool):
             return f"✓ **{title}**\n\n{details}"
         return f"✓ **{title}**"
 
-    def _get_plan(self, chat_id: str, plan_id: Optional[int]) -> Optional[Plan]:
+    def _get_plan(self, chat_id: str, plan_id: Optional[int]) -> Optional["Plan"]:
         """Retrieve a plan by ID or most recent for chat_id."""
+        from suzent.plan import read_plan_by_id, read_plan_from_database
+
         plan = None
 
         if plan_id is not None:
@@ -197,6 +198,8 @@ class PlanningTool(Tool):
         self, chat_id: str, goal: Optional[str], phases: list[dict]
     ) -> str:
         """Create or update a plan."""
+        from suzent.plan import Phase, Plan, write_plan_to_database
+
         existing_plan = self._get_plan(chat_id, None)
         objective = (
             goal if goal else (existing_plan.objective if existing_plan else "No Goal")
@@ -234,39 +237,44 @@ class PlanningTool(Tool):
         self, chat_id: str, current_phase_id: int, next_phase_id: int
     ) -> str:
         """Advance the plan from current phase to next."""
+        from suzent.database import get_database
+
         plan = self._get_plan(chat_id, None)
         if not plan:
             return self._format_error(
                 "No plan exists", "Create a plan first using 'update'"
             )
 
-        # Find phases
-        try:
-            next_phase_idx = next(
-                i for i, p in enumerate(plan.phases) if p.number == next_phase_id
-            )
-        except StopIteration:
+        # Find phases with one pass over the plan
+        phase_index = {p.number: i for i, p in enumerate(plan.phases)}
+        next_phase_idx = phase_index.get(next_phase_id)
+        if next_phase_idx is None:
             return self._format_error(
                 "Invalid next_phase_id", f"Phase {next_phase_id} not found"
             )
 
-        current_phase = next(
-            (p for p in plan.phases if p.number == current_phase_id), None
-        )
-        if not current_phase:
+        current_phase_idx = phase_index.get(current_phase_id)
+        if current_phase_idx is None:
             return self._format_error(
                 "Invalid current_phase_id", f"Phase {current_phase_id} not found"
             )
 
+        current_phase = plan.phases[current_phase_idx]
         next_phase = plan.phases[next_phase_idx]
 
-        # Mark all phases before the next phase as completed (handling skips)
-        for i in range(next_phase_idx):
-            plan.phases[i].status = "completed"
-
-        next_phase.status = "in_progress"
+        # Mark all phases before the next phase as completed (handling skips),
+        # collecting only the statuses that actually change
+        changed = {}
+        for i, phase in enumerate(plan.phases[: next_phase_idx + 1]):
+            status = "in_progress" if i == next_phase_idx else "completed"
+            if phase.status != status:
+                phase.status = status
+                changed[phase.number] = status
 
-        write_plan_to_database(plan, preserve_history=True)
+        # Only statuses change here, so update those task rows in place
+        # rather than rewriting the whole plan; repeated advances write nothing
+        if changed:
+            get_database().update_task_statuses(plan.id, changed)
 
         return self._format_plan_output(
             plan,
@@ -277,28 +285,32 @@ class PlanningTool(Tool):
 
     def _format_plan_output(
         self,
-        plan: Plan,
+        plan: "Plan",
         header: str,
-        previous_phase: Optional[Phase] = None,
-        next_phase: Optional[Phase] = None,
+        previous_phase: Optional["Phase"] = None,
+        next_phase: Optional["Phase"] = None,
     ) -> str:
         """Format the plan output as requested."""
-        phases_str = "; ".join([f"{p.number}: {p.description}" for p in plan.phases])
-        # Truncate phases str if too long? "..." was in example.
-        # Making it simple: "1: Title; 2: Title"
+        phases_str = "; ".join(f"{p.number}: {p.description}" for p in plan.phases)
 
-        current = plan.first_in_progress()
-        current_str = f"{current.number}. {current.description}" if current else "None"
-
-        output = (
-            f"{header}:\n<task_plan>\nGoal: {plan.objective}\nPhases: {phases_str}\n"
-        )
+        lines = [
+            f"{header}:",
+            "<task_plan>",
+            f"Goal: {plan.objective}",
+            f"Phases: {phases_str}",
+        ]
 
         if previous_phase and next_phase:
-            output += f"Previous phase: {previous_phase.number}. {previous_phase.description}\n"
-            output += f"Next phase: {next_phase.number}. {next_phase.description}\n"
+            lines.append(
+                f"Previous phase: {previous_phase.number}. {previous_phase.description}"
+            )
+            lines.append(f"Next phase: {next_phase.number}. {next_phase.description}")
         else:
-            output += f"Current phase: {current_str}\n"
+            current = plan.first_in_progress()
+            current_str = (
+                f"{current.number}. {current.description}" if current else "None"
+            )
+            lines.append(f"Current phase: {current_str}")
 
-        output += "</task_plan>"
-        return output
+        lines.append("</task_plan>")
+        return "\n".join(lines)
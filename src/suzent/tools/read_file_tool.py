@@ -5,15 +5,107 @@ Supports reading text files directly and converting various file formats
 (PDF, DOCX, XLSX, images, etc.) to markdown via MarkItDown.
 """
 
+import os
+import stat
+import threading
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO, Tuple
 
 from smolagents.tools import Tool
 from suzent.logger import get_logger
 from suzent.tools.path_resolver import PathResolver
 
+__tools__ = ("ReadFileTool",)
+
 logger = get_logger(__name__)
 
+# Process-wide MarkItDown converter, created on first document conversion
+_converter = None
+
+# Converted markdown keyed by (path, mtime_ns, size), so reopening an
+# unchanged document with a different offset/limit skips conversion
+_CONVERT_CACHE_SIZE = 32
+_convert_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_convert_cache_lock = threading.Lock()
+
+# Chunk size used when counting lines without splitting them
+_COUNT_CHUNK_SIZE = 1 << 20
+
+
+def _count_remaining_lines(f: TextIO) -> int:
+    """Count the lines left in a text stream by scanning newlines in chunks."""
+    count = 0
+    last_chunk = ""
+    for chunk in iter(lambda: f.read(_COUNT_CHUNK_SIZE), ""):
+        count += chunk.count("\n")
+        last_chunk = chunk
+    # A final line without a trailing newline still counts
+    if last_chunk and not last_chunk.endswith("\n"):
+        count += 1
+    return count
+
+
+def _get_converter():
+    """Get the shared MarkItDown converter, initializing it on first use."""
+    global _converter
+    if _converter is None:
+        from markitdown import MarkItDown
+
+        logger.info("Initializing MarkItDown converter (lazy load)...")
+        _converter = MarkItDown()
+    return _converter
+
+
+def _convert_to_markdown(path: Path, stat_result: os.stat_result) -> str:
+    """Convert a document to markdown, reusing the result while it is unchanged."""
+    key = (str(path), stat_result.st_mtime_ns, stat_result.st_size)
+    with _convert_cache_lock:
+        content = _convert_cache.get(key)
+        if content is not None:
+            _convert_cache.move_to_end(key)
+            return content
+
+    logger.info(f"Converting file to markdown: {path}")
+    result = _get_converter().convert(str(path))
+    content = result.text_content if hasattr(result, "text_content") else str(result)
+    content = content or ""
+
+    with _convert_cache_lock:
+        _convert_cache[key] = content
+        _convert_cache.move_to_end(key)
+        if len(_convert_cache) > _CONVERT_CACHE_SIZE:
+            _convert_cache.popitem(last=False)
+    return content
+
+
+def _slice_lines(text: str, start: int, limit: Optional[int]) -> str:
+    """
+    Return lines [start, start + limit) of text without splitting all of it.
+
+    Equivalent to "\n".join(text.split("\n")[start:start + limit]), walking
+    newline offsets with str.find instead of building a list of every line.
+    """
+    begin = 0
+    for _ in range(start):
+        newline = text.find("\n", begin)
+        if newline < 0:
+            return ""
+        begin = newline + 1
+
+    if not limit or limit < 0:
+        return text[begin:]
+
+    stop = begin
+    for _ in range(limit):
+        newline = text.find("\n", stop)
+        if newline < 0:
+            return text[begin:]
+        stop = newline + 1
+    # Drop the separator after the last selected line
+    return text[begin : stop - 1]
+
 
 class ReadFileTool(Tool):
     """
@@ -59,7 +151,6 @@ Examples:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._resolver: Optional[PathResolver] = None
-        self._converter = None
 
     def set_context(self, resolver: PathResolver) -> None:
         """Set the path resolver context."""
@@ -86,11 +177,13 @@ Examples:
             # Resolve the path
             resolved_path = self._resolver.resolve(file_path)
 
-            # Check if file exists
-            if not resolved_path.exists():
+            # One stat call answers both "exists" and "is a regular file"
+            try:
+                stat_result = resolved_path.stat()
+            except OSError:
                 return f"Error: File not found: {file_path}"
 
-            if not resolved_path.is_file():
+            if not stat.S_ISREG(stat_result.st_mode):
                 return f"Error: Path is not a file: {file_path}"
 
             # Get file extension
@@ -128,7 +221,7 @@ Examples:
                 return self._read_text_file(resolved_path, offset, limit)
             else:
                 # Use MarkItDown for other formats
-                return self._convert_file(resolved_path, offset, limit)
+                return self._convert_file(resolved_path, stat_result, offset, limit)
 
         except ValueError as e:
             return f"Error: {str(e)}"
@@ -142,68 +235,49 @@ Examples:
         """Read a text file with offset/limit support."""
         try:
             with open(path, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
-
-            total_lines = len(lines)
-
-            # Apply offset
-            start = offset or 0
-            if start < 0:
-                start = 0
-            if start >= total_lines:
-                return f"(File has {total_lines} lines, offset {start} is beyond end)"
-
-            # Apply limit
-            if limit is not None and limit > 0:
-                end = min(start + limit, total_lines)
-            else:
-                end = total_lines
-
-            selected_lines = lines[start:end]
-            content = "".join(selected_lines)
+                if offset is None and limit is None:
+                    return f.read()
+
+                # Stream past the offset and keep only the requested window,
+                # rather than materializing every line of the file
+                start = max(offset or 0, 0)
+                skipped = sum(1 for _ in islice(f, start))
+                if limit is not None and limit > 0:
+                    selected_lines = list(islice(f, limit))
+                    total_lines = (
+                        start + len(selected_lines) + _count_remaining_lines(f)
+                    )
+                else:
+                    selected_lines = f.readlines()
+                    total_lines = start + len(selected_lines)
 
-            # Add info header if using offset/limit
-            if offset is not None or limit is not None:
-                header = f"[Lines {start + 1}-{end} of {total_lines}]\n"
-                return header + content
+            if not selected_lines:
+                return f"(File has {skipped} lines, offset {start} is beyond end)"
 
-            return content
+            end = start + len(selected_lines)
+            header = f"[Lines {start + 1}-{end} of {total_lines}]\n"
+            return header + "".join(selected_lines)
 
         except UnicodeDecodeError:
             return "Error: File appears to be binary, cannot read as text"
 
     def _convert_file(
-        self, path: Path, offset: Optional[int], limit: Optional[int]
+        self,
+        path: Path,
+        stat_result: os.stat_result,
+        offset: Optional[int],
+        limit: Optional[int],
     ) -> str:
         """Convert file to markdown using MarkItDown."""
         try:
-            if self._converter is None:
-                from markitdown import MarkItDown
-
-                logger.info("Initializing MarkItDown converter (lazy load)...")
-                self._converter = MarkItDown()
-
-            logger.info(f"Converting file to markdown: {path}")
-            result = self._converter.convert(str(path))
-
-            # Get content from result
-            if hasattr(result, "text_content"):
-                content = result.text_content
-            else:
-                content = str(result)
+            content = _convert_to_markdown(path, stat_result)
 
             if not content or not content.strip():
                 return f"Warning: File converted but appears empty: {path.name}"
 
             # Apply offset/limit to converted content
             if offset is not None or limit is not None:
-                lines = content.split("\n")
-                start = offset or 0
-                if limit:
-                    lines = lines[start : start + limit]
-                else:
-                    lines = lines[start:]
-                content = "\n".join(lines)
+                content = _slice_lines(content, max(offset or 0, 0), limit)
 
             logger.info(f"Successfully converted: {path.name} ({len(content)} chars)")
             return content
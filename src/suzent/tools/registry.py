@@ -3,12 +3,14 @@ Tool registry module for auto-discovery of tool classes.
 
 This module provides:
 - Convention-based discovery of tool classes from suzent/tools/*.py
+  (modules may list their tool class names in a ``__tools__`` tuple)
 - Mapping of tool class names to their module paths
 - Functions to get tool classes by name and list available tools
 """
 
 import importlib
 import pkgutil
+import sys
 from typing import Dict, Type, Optional, List
 
 from smolagents.tools import Tool
@@ -20,6 +22,9 @@ logger = get_logger(__name__)
 # Cache for discovered tools: {ClassName: module_name}
 _tool_registry: Optional[Dict[str, str]] = None
 
+# Cache for resolved tool classes: {ClassName: class}
+_tool_classes: Dict[str, Type[Tool]] = {}
+
 
 def _discover_tools() -> Dict[str, str]:
     """
@@ -47,16 +52,24 @@ def _discover_tools() -> Dict[str, str]:
             try:
                 module = importlib.import_module(f"suzent.tools.{modname}")
 
-                # Find all Tool subclasses in the module
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
+                # Modules that declare their tools skip the attribute scan
+                declared = getattr(module, "__tools__", None)
+                if declared is not None:
+                    for attr_name in declared:
+                        _tool_registry[attr_name] = modname
+                        logger.debug(f"Discovered tool: {attr_name} in {modname}")
+                    continue
+
+                # Find all Tool subclasses in the module. Check the naming
+                # convention (tool classes end with "Tool") before the type
+                # checks so most module globals are skipped cheaply.
+                for attr_name, attr in vars(module).items():
+                    if not attr_name.endswith("Tool"):
+                        continue
                     if (
                         isinstance(attr, type)
                         and issubclass(attr, Tool)
                         and attr is not Tool
-                        and attr_name.endswith(
-                            "Tool"
-                        )  # Convention: tool classes end with "Tool"
                     ):
                         _tool_registry[attr_name] = modname
                         logger.debug(f"Discovered tool: {attr_name} in {modname}")
@@ -95,17 +108,28 @@ def get_tool_class(tool_name: str) -> Optional[Type[Tool]]:
     Returns:
         The tool class, or None if not found.
     """
+    tool_class = _tool_classes.get(tool_name)
+    if tool_class is not None:
+        return tool_class
+
     module_name = get_tool_module(tool_name)
     if not module_name:
         return None
 
+    # Discovery has usually imported the module already; only go through
+    # the import machinery (and its lock) on a miss.
+    full_name = f"suzent.tools.{module_name}"
     try:
-        module = importlib.import_module(f"suzent.tools.{module_name}")
-        return getattr(module, tool_name, None)
+        module = sys.modules.get(full_name) or importlib.import_module(full_name)
+        tool_class = getattr(module, tool_name, None)
     except (ImportError, AttributeError) as e:
         logger.error(f"Could not load tool {tool_name}: {e}")
         return None
 
+    if tool_class is not None:
+        _tool_classes[tool_name] = tool_class
+    return tool_class
+
 
 def list_available_tools() -> List[str]:
     """
@@ -2,6 +2,9 @@ from smolagents.tools import Tool
 from suzent.skills import get_skill_manager
 
 
+__tools__ = ("SkillTool",)
+
+
 class SkillTool(Tool):
     name = "skill_tool"
     description = "Load a skill to gain specialized knowledge for a task."
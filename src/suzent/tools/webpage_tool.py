@@ -1,15 +1,23 @@
 import re
+import atexit
 import asyncio
+import functools
+import threading
+from contextlib import AsyncExitStack
 from urllib.parse import urlparse
-from typing import Union
+from typing import Any, ClassVar, Coroutine, Optional, TypeVar, Union
 
 from crawl4ai import AsyncWebCrawler
 from smolagents.tools import Tool
 
 from suzent.logger import get_logger
 
+__tools__ = ("WebpageTool",)
+
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
 # ---------------------------------------------------------------------------
 # Security constants
 # ---------------------------------------------------------------------------
@@ -23,45 +31,101 @@ BLOCKED_DOMAINS: set[str] = set()
 # Max characters returned to the LLM to avoid context overflow
 MAX_CONTENT_LENGTH = 50_000
 
+# Max characters kept from the crawler; headroom over MAX_CONTENT_LENGTH so
+# _sanitize_content still sees the page as oversized and marks it truncated
+_CRAWL_CHAR_LIMIT = MAX_CONTENT_LENGTH * 2
+
+# Max pages crawled at once by forward_batch (one browser tab each)
+MAX_CONCURRENT_FETCHES = 4
+
 # ---------------------------------------------------------------------------
 # Prompt injection detection
 # ---------------------------------------------------------------------------
 
-# Regex patterns covering common prompt injection techniques
-_INJECTION_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"ignore\s+(all\s+)?(previous|above|prior)\s+(instructions?|prompts?|rules?)", re.IGNORECASE),
-    re.compile(r"you\s+are\s+now\b", re.IGNORECASE),
-    re.compile(r"new\s+(system\s+)?prompt", re.IGNORECASE),
-    re.compile(r"</?system>", re.IGNORECASE),
-    re.compile(r"\[INST\]|\[/INST\]", re.IGNORECASE),                # Llama chat format
-    re.compile(r"<\|im_start\|>|<\|im_end\|>", re.IGNORECASE),       # ChatML format
-    re.compile(r"###\s*(system|assistant)\b", re.IGNORECASE),         # Markdown role declaration
-    re.compile(r"act\s+as\s+(a\s+)?.*?(admin|root|developer|system)", re.IGNORECASE),
-    re.compile(r"(forget|disregard|override)\s+.*?(safety|rules?|instructions?|guidelines?)", re.IGNORECASE),
-    re.compile(r"you\s+(must|should|have\s+to)\s+.{0,30}(ignore|bypass|skip)", re.IGNORECASE),
-]
-
-
-def _detect_injection(content: str) -> list[str]:
+# Regex sources covering common prompt injection techniques
+_INJECTION_PATTERN_SOURCES: tuple[str, ...] = (
+    r"ignore\s+(all\s+)?(previous|above|prior)\s+(instructions?|prompts?|rules?)",
+    r"you\s+are\s+now\b",
+    r"new\s+(system\s+)?prompt",
+    r"</?system>",
+    r"\[INST\]|\[/INST\]",  # Llama chat format
+    r"<\|im_start\|>|<\|im_end\|>",  # ChatML format
+    r"###\s*(system|assistant)\b",  # Markdown role declaration
+    r"act\s+as\s+(a\s+)?.*?(admin|root|developer|system)",
+    r"(forget|disregard|override)\s+.*?(safety|rules?|instructions?|guidelines?)",
+    r"you\s+(must|should|have\s+to)\s+.{0,30}(ignore|bypass|skip)",
+)
+
+# All sources joined into one alternation so the content is scanned once
+_INJECTION_RE = re.compile(
+    "|".join(f"(?:{source})" for source in _INJECTION_PATTERN_SOURCES),
+    re.IGNORECASE,
+)
+
+# Lowercase literals of which every injection match contains at least one.
+# Keep in sync with the sources above: each new pattern needs a literal here.
+_INJECTION_LITERALS: tuple[str, ...] = (
+    "ignore",
+    "now",
+    "prompt",
+    "system",
+    "inst]",
+    "<|im_",
+    "###",
+    "admin",
+    "root",
+    "developer",
+    "forget",
+    "disregard",
+    "override",
+    "bypass",
+    "skip",
+)
+
+
+def _may_contain_injection(content: str) -> bool:
+    """Cheap literal prefilter run before the injection regex.
+
+    Only ASCII content is prefiltered. IGNORECASE also folds some non-ASCII
+    characters onto ASCII letters (e.g. "ı" matches "i"), which a plain
+    lower() would miss, so anything else always goes to the regex.
+    """
+    if not content.isascii():
+        return True
+    lowered = content.lower()
+    return any(literal in lowered for literal in _INJECTION_LITERALS)
+
+
+def _detect_injection(content: str, max_hits: int = 5) -> list[str]:
     """Scan content for prompt injection patterns.
 
     Args:
         content: The text to scan.
+        max_hits: Stop scanning once this many snippets are found. Any hit
+            blocks the page, so further matches would only lengthen the report.
 
     Returns:
         A list of suspicious snippets (with surrounding context).
         An empty list means no injection was detected.
     """
     hits: list[str] = []
-    for pattern in _INJECTION_PATTERNS:
-        for match in pattern.finditer(content):
-            # Capture 40 chars of context around each match
-            start = max(0, match.start() - 40)
-            end = min(len(content), match.end() + 40)
-            hits.append(content[start:end])
+    if not _may_contain_injection(content):
+        return hits
+    content_len = len(content)
+    for match in _INJECTION_RE.finditer(content):
+        # Capture 40 chars of context around each match
+        start = max(0, match.start() - 40)
+        end = min(content_len, match.end() + 40)
+        hits.append(content[start:end])
+        if len(hits) >= max_hits:
+            break
     return hits
 
 
+# Residual HTML tag, stripped from crawled content
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
 def _sanitize_content(content: str) -> str:
     """Truncate oversized content and strip residual HTML tags.
 
@@ -72,11 +136,15 @@ def _sanitize_content(content: str) -> str:
         Cleaned content, safe to pass to the LLM.
     """
     if len(content) > MAX_CONTENT_LENGTH:
-        logger.warning("WebpageTool: content exceeded %d chars, truncating", MAX_CONTENT_LENGTH)
+        logger.warning(
+            "WebpageTool: content exceeded %d chars, truncating", MAX_CONTENT_LENGTH
+        )
         content = content[:MAX_CONTENT_LENGTH] + "\n\n[Content truncated]"
 
-    # Strip any residual HTML tags (crawl4ai outputs markdown, but belt-and-suspenders)
-    content = re.sub(r"<[^>]+>", "", content)
+    # Strip any residual HTML tags (crawl4ai outputs markdown, but belt-and-suspenders).
+    # Most pages contain no "<" at all, so skip the regex pass for them.
+    if "<" in content:
+        content = _HTML_TAG_RE.sub("", content)
     return content
 
 
@@ -85,6 +153,31 @@ def _sanitize_content(content: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _is_blocked_host(hostname: str) -> bool:
+    """Check a hostname and each of its parent domains against BLOCKED_DOMAINS.
+
+    Costs one set lookup per label, independent of the blocklist size.
+    """
+    start = 0
+    while True:
+        if hostname[start:] in BLOCKED_DOMAINS:
+            return True
+        start = hostname.find(".", start) + 1
+        if not start:
+            return False
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_url(url: str) -> tuple[str, Optional[str]]:
+    """Parse a URL into (scheme, lowercase hostname), memoized per URL.
+
+    Only parsing is cached; policy checks against ALLOWED_SCHEMES and
+    BLOCKED_DOMAINS run on every call so runtime changes apply immediately.
+    """
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.hostname
+
+
 def _validate_url(url: str) -> tuple[bool, str]:
     """Validate a URL against the security policy.
 
@@ -105,26 +198,138 @@ def _validate_url(url: str) -> tuple[bool, str]:
         return False, "URL is empty."
 
     try:
-        parsed = urlparse(url)
+        scheme, hostname = _split_url(url)
     except Exception as e:
         return False, f"Failed to parse URL: {e}"
 
     # Scheme whitelist
-    if parsed.scheme.lower() not in ALLOWED_SCHEMES:
-        return False, f"Scheme '{parsed.scheme}' is not allowed. Permitted: {ALLOWED_SCHEMES}"
+    if scheme.lower() not in ALLOWED_SCHEMES:
+        return (
+            False,
+            f"Scheme '{scheme}' is not allowed. Permitted: {ALLOWED_SCHEMES}",
+        )
 
     # Must have a valid host
-    if not parsed.hostname:
+    if not hostname:
         return False, "URL has no valid hostname."
 
     # Domain blocklist (includes subdomains)
-    hostname = parsed.hostname.lower()
-    if any(hostname == blocked or hostname.endswith("." + blocked) for blocked in BLOCKED_DOMAINS):
+    if _is_blocked_host(hostname):
         return False, f"Domain '{hostname}' is on the blocked list."
 
     return True, ""
 
 
+# ---------------------------------------------------------------------------
+# Shared crawler
+# ---------------------------------------------------------------------------
+
+
+class _CrawlerSession:
+    """Process-wide crawler and the background event loop it runs on.
+
+    Agents are rebuilt (and their tools re-instantiated) on every config or
+    chat change, so the browser lives here rather than on WebpageTool; a
+    single atexit hook shuts it down.
+
+    Fetches lease the crawler for one generation. A fetch that hits a
+    browser-level failure retires that generation: later fetches get a fresh
+    browser, and the broken one is closed once its last in-flight fetch is done.
+    """
+
+    _instance: ClassVar[Optional["_CrawlerSession"]] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._crawler: Optional[AsyncWebCrawler] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._crawler_lock: Optional[asyncio.Lock] = None
+        self._generation = 0
+        # generation -> fetches still using that generation's crawler
+        self._in_flight: dict[int, int] = {}
+        # generation -> exit stack of a retired crawler awaiting its last fetch
+        self._retired: dict[int, AsyncExitStack] = {}
+
+    @classmethod
+    def get_instance(cls) -> "_CrawlerSession":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.close)
+        return cls._instance
+
+    def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the background loop and wait for its result."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="WebpageTool-loop", daemon=True
+                ).start()
+                self._loop = loop
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def acquire(self) -> tuple[int, AsyncWebCrawler]:
+        """Lease the current crawler, starting it on first use."""
+        if self._crawler_lock is None:
+            self._crawler_lock = asyncio.Lock()
+        async with self._crawler_lock:
+            if self._crawler is None:
+                exit_stack = AsyncExitStack()
+                self._crawler = await exit_stack.enter_async_context(AsyncWebCrawler())
+                self._exit_stack = exit_stack
+            generation = self._generation
+            self._in_flight[generation] = self._in_flight.get(generation, 0) + 1
+            return generation, self._crawler
+
+    async def release(self, generation: int, broken: bool = False) -> None:
+        """Return a lease; retire its crawler first if the browser broke."""
+        if broken and generation == self._generation and self._exit_stack is not None:
+            self._retired[generation] = self._exit_stack
+            self._exit_stack, self._crawler = None, None
+            self._generation += 1
+
+        remaining = self._in_flight.get(generation, 1) - 1
+        if remaining:
+            self._in_flight[generation] = remaining
+            return
+        self._in_flight.pop(generation, None)
+        exit_stack = self._retired.pop(generation, None)
+        if exit_stack is not None:
+            try:
+                await exit_stack.aclose()
+            except Exception as e:
+                logger.warning("WebpageTool: error closing crawler: %s", e)
+
+    async def _close_crawlers(self) -> None:
+        """Close the current and any retired crawlers. Runs on the loop."""
+        exit_stacks = list(self._retired.values())
+        if self._exit_stack is not None:
+            exit_stacks.append(self._exit_stack)
+        self._retired.clear()
+        self._in_flight.clear()
+        self._exit_stack, self._crawler = None, None
+        self._generation += 1
+        for exit_stack in exit_stacks:
+            await exit_stack.aclose()
+
+    def close(self) -> None:
+        """Shut down the crawlers and stop the background loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_crawlers(), loop).result()
+        except Exception as e:
+            logger.warning("WebpageTool: error closing crawler: %s", e)
+        finally:
+            self._crawler_lock = None
+            loop.call_soon_threadsafe(loop.stop)
+
+
 # ---------------------------------------------------------------------------
 # Tool
 # ---------------------------------------------------------------------------
@@ -162,17 +367,41 @@ class WebpageTool(Tool):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the shared background loop and wait for its result."""
+        return _CrawlerSession.get_instance().run(coro)
+
     async def _crawl_url(self, url: str) -> str:
-        """Async helper to properly initialize and use the crawler."""
-        async with AsyncWebCrawler() as crawler:
+        """Fetch a URL with the shared crawler and return its markdown."""
+        session = _CrawlerSession.get_instance()
+        generation, crawler = await session.acquire()
+        broken = False
+        try:
             result = await crawler.arun(url=url)
-            if not result:
-                return "Error: Unable to retrieve content from the specified URL."
-            # Convert to plain str to avoid pickle issues with StringCompatibleMarkdown
-            # (crawl4ai's str subclass fails to unpickle because its __new__ expects
-            # a MarkdownGenerationResult object, not a raw string)
-            markdown = result.markdown
-            return str(markdown) if markdown else ""
+        except Exception:
+            # arun reports page-level failures in its result, so an exception
+            # means the browser itself is in a bad state
+            broken = True
+            raise
+        finally:
+            await session.release(generation, broken)
+        if not result or not result.success:
+            if result:
+                logger.warning(
+                    "WebpageTool: crawl failed url=%s, error=%s",
+                    url,
+                    result.error_message,
+                )
+            return "Error: Unable to retrieve content from the specified URL."
+        markdown = result.markdown
+        if not markdown:
+            return ""
+        # Cap the size before copying anything. Slicing also yields a plain str,
+        # which avoids pickle issues with StringCompatibleMarkdown (crawl4ai's
+        # str subclass fails to unpickle because its __new__ expects a
+        # MarkdownGenerationResult object, not a raw string)
+        text = markdown if isinstance(markdown, str) else str(markdown)
+        return text[:_CRAWL_CHAR_LIMIT]
 
     # ------------------------------------------------------------------
     # Public interface
@@ -188,20 +417,63 @@ class WebpageTool(Tool):
             Sanitized page content, or an error/warning message if
             validation or injection checks fail.
         """
-        # 1. Validate URL
-        valid, reason = _validate_url(url)
-        if not valid:
-            logger.warning("WebpageTool: URL validation failed — %s | url=%s", reason, url)
-            return f"[WebpageTool Error] URL validation failed: {reason}"
+        return self.forward_batch([url])[0]
 
-        logger.info("WebpageTool: fetching url=%s", url)
+    def forward_batch(self, urls: list[str]) -> list[str]:
+        """Fetch several web pages concurrently on the shared crawler.
 
-        # 2. Fetch content
-        try:
-            raw_content = asyncio.run(self._crawl_url(url))
-        except Exception as e:
-            logger.error("WebpageTool: fetch failed url=%s, error=%s", url, e)
-            return f"[WebpageTool Error] Fetch failed: {e}"
+        Each URL goes through the same validation, sanitization, and
+        injection checks as forward(). Duplicate URLs are fetched once.
+
+        Args:
+            urls: Target URLs (http/https only).
+
+        Returns:
+            One result per input URL, in input order.
+        """
+        results: dict[str, str] = {}
+        to_fetch: list[str] = []
+
+        # 1. Validate URLs before scheduling any fetch
+        for url in dict.fromkeys(urls):
+            valid, reason = _validate_url(url)
+            if not valid:
+                logger.warning(
+                    "WebpageTool: URL validation failed — %s | url=%s", reason, url
+                )
+                results[url] = f"[WebpageTool Error] URL validation failed: {reason}"
+                continue
+            logger.info("WebpageTool: fetching url=%s", url)
+            to_fetch.append(url)
+
+        # 2. Fetch content, overlapping the network waits
+        if to_fetch:
+            try:
+                fetched = self._run(self._crawl_many(to_fetch))
+            except Exception as e:
+                fetched = [e] * len(to_fetch)
+            for url, raw_content in zip(to_fetch, fetched):
+                results[url] = self._check_content(url, raw_content)
+
+        return [results[url] for url in urls]
+
+    async def _crawl_many(self, urls: list[str]) -> list[Union[str, BaseException]]:
+        """Crawl URLs concurrently, returning content or the raised exception."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def crawl(url: str) -> str:
+            async with semaphore:
+                return await self._crawl_url(url)
+
+        return await asyncio.gather(
+            *(crawl(url) for url in urls), return_exceptions=True
+        )
+
+    def _check_content(self, url: str, raw_content: Union[str, BaseException]) -> str:
+        """Sanitize fetched content and block it if injection is detected."""
+        if isinstance(raw_content, BaseException):
+            logger.error("WebpageTool: fetch failed url=%s, error=%s", url, raw_content)
+            return f"[WebpageTool Error] Fetch failed: {raw_content}"
 
         # 3. Sanitize (truncate + strip tags)
         content = _sanitize_content(raw_content)
@@ -221,5 +493,7 @@ class WebpageTool(Tool):
                 + "\n".join(f"  - `{hit}`" for hit in injection_hits)
             )
 
-        logger.info("WebpageTool: fetch successful url=%s, length=%d", url, len(content))
+        logger.info(
+            "WebpageTool: fetch successful url=%s, length=%d", url, len(content)
+        )
         return content
@@ -10,15 +10,118 @@ SearXNG provides privacy-focused meta-search with customizable parameters.
 
 import os
 import json
+import asyncio
+import importlib.util
+import threading
+import time
 import httpx
+from collections import OrderedDict
 from urllib.parse import urlparse
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from smolagents.tools import Tool
 from suzent.logger import get_logger
 
+__tools__ = ("WebSearchTool",)
+
 logger = get_logger(__name__)
 
+# HTTP/2 lets successive queries share one connection; it needs the optional h2
+# package, so fall back to HTTP/1.1 keep-alive when it is missing
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection reuse for the SearXNG client across an agent's queries
+_SEARXNG_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=50, keepalive_expiry=60.0
+)
+_SEARXNG_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Agents often repeat a query while reasoning; serve repeats from memory
+_SEARCH_CACHE_SIZE = 256
+_SEARCH_CACHE_TTL = 300.0
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Tuple, Tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Descriptions are collapsed to single spaces and cut to this many characters
+_DESCRIPTION_LIMIT = 300
+# Any _DESCRIPTION_SPLIT whitespace-separated tokens join to more than
+# _DESCRIPTION_LIMIT characters, so splitting further cannot change the output
+_DESCRIPTION_SPLIT = _DESCRIPTION_LIMIT // 2 + 1
+
+
+def _clean_description(content: str) -> str:
+    """Collapse whitespace and truncate, touching only the prefix that is kept."""
+    parts = content.split(None, _DESCRIPTION_SPLIT)
+    if len(parts) > _DESCRIPTION_SPLIT:
+        del parts[_DESCRIPTION_SPLIT:]
+    content = " ".join(parts)
+    if len(content) > _DESCRIPTION_LIMIT:
+        content = content[: _DESCRIPTION_LIMIT - 3] + "..."
+    return content
+
+
+def _default_fields(result: Dict[str, Any]) -> Tuple[Any, Any]:
+    """URL and description, normalized across SearXNG and DDGS field names."""
+    url = result.get("url") or result.get("href") or ""
+    content = result.get("content") or result.get("body") or ""
+    return url, content
+
+
+def _image_fields(result: Dict[str, Any]) -> Tuple[Any, Any]:
+    # DDGS images: 'title', 'image', 'thumbnail', 'url', 'height', 'width', 'source'
+    image_url = result.get("image", "")
+    thumbnail = result.get("thumbnail", "")
+    return result.get("url"), f"Image: {image_url}\nThumbnail: {thumbnail}"
+
+
+def _video_fields(result: Dict[str, Any]) -> Tuple[Any, Any]:
+    # DDGS videos: 'title', 'content', 'embed_url', 'deputy_id', 'description', 'images', 'uploader', 'duration', 'published'
+    url = result.get("url") or result.get("href") or ""
+    description = result.get("description", "")
+    uploader = result.get("uploader", "")
+    duration = result.get("duration", "")
+    return url, f"{description}\nUploader: {uploader} | Duration: {duration}"
+
+
+def _news_fields(result: Dict[str, Any]) -> Tuple[Any, Any]:
+    # DDGS news: 'date', 'title', 'body', 'url', 'image', 'source'
+    url, content = _default_fields(result)
+    date = result.get("date", "")
+    source_news = result.get("source", "")
+    return url, f"{content}\nDate: {date} | Source: {source_news}"
+
 
 class WebSearchTool(Tool):
     """
@@ -43,6 +146,18 @@ class WebSearchTool(Tool):
         "year": "y",
         "y": "y",
     }
+    # Per-category field extraction, chosen once per result set
+    _CATEGORY_FIELDS = {
+        "images": _image_fields,
+        "videos": _video_fields,
+        "news": _news_fields,
+    }
+
+    # Lower- and upper-case tokens, so the common cases skip str.lower()
+    _TIME_LIMITS = {
+        **TIME_RANGE_MAPPING,
+        **{k.upper(): v for k, v in TIME_RANGE_MAPPING.items()},
+    }
 
     inputs = {
         "query": {"type": "string", "description": "The search query string."},
@@ -77,12 +192,17 @@ class WebSearchTool(Tool):
         self.use_searxng = self._validate_searxng_url(self.searxng_base_url)
 
         self.client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        # Async counterpart for aforward, created on first use
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._cache = _TTLCache(_SEARCH_CACHE_SIZE, _SEARCH_CACHE_TTL)
+        # One DDGS instance keeps its engine sessions alive across searches
+        self._ddgs = None
+        self._ddgs_lock = threading.Lock()
 
         if self.use_searxng:
             self._init_searxng_client()
 
-        # DDGS is initialized lazily per request
-
     def _validate_searxng_url(self, url: Optional[str]) -> bool:
         """Validate the SearXNG URL."""
         if not url or not url.strip():
@@ -95,20 +215,32 @@ class WebSearchTool(Tool):
             logger.warning(f"Invalid SEARXNG_BASE_URL provided: {url}")
             return False
 
-    def _init_searxng_client(self):
-        """Initialize the HTTP client for SearXNG."""
-        logger.info(f"Using SearXNG at {self.searxng_base_url}")
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """Shared configuration for the sync and async SearXNG clients."""
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "application/json",
             "Accept-Language": "en-US,en;q=0.9",
         }
-        self.client = httpx.Client(
-            base_url=self.searxng_base_url,
-            timeout=30.0,
-            headers=headers,
-            follow_redirects=True,
-        )
+        return {
+            "base_url": self.searxng_base_url,
+            "http2": _HTTP2_AVAILABLE,
+            "timeout": _SEARXNG_TIMEOUT,
+            "limits": _SEARXNG_LIMITS,
+            "headers": headers,
+            "follow_redirects": True,
+        }
+
+    def _init_searxng_client(self):
+        """Initialize the HTTP client for SearXNG."""
+        logger.info(f"Using SearXNG at {self.searxng_base_url}")
+        self.client = httpx.Client(**self._client_kwargs())
+
+    async def _ensure_aclient(self) -> httpx.AsyncClient:
+        """Get the async SearXNG client, creating it on first use."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(**self._client_kwargs())
+        return self._aclient
 
     def forward(
         self,
@@ -121,14 +253,107 @@ class WebSearchTool(Tool):
         """
         Perform a web search using either SearXNG or the default search tool.
         """
+        key = self._cache_key(query, categories, max_results, time_range, page)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         if self.use_searxng:
-            return self._search_with_searxng(
+            result, answered = self._search_with_searxng(
                 query, categories, max_results, time_range, page
             )
         else:
-            return self._search_with_ddgs(
+            result = self._search_with_ddgs(
                 query, categories, max_results, time_range, page
             )
+            answered = True
+
+        if answered:
+            self._store(key, result)
+        return result
+
+    async def aforward(
+        self,
+        query: str,
+        categories: Optional[str] = None,
+        max_results: Optional[int] = 10,
+        time_range: Optional[str] = None,
+        page: Optional[int] = 1,
+    ) -> str:
+        """
+        Async variant of forward, so several searches can overlap their I/O.
+
+        DDGS has no async API, so DDGS searches run in a worker thread.
+        """
+        key = self._cache_key(query, categories, max_results, time_range, page)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self.use_searxng:
+            result, answered = await self._asearch_with_searxng(
+                query, categories, max_results, time_range, page
+            )
+        else:
+            result = await asyncio.to_thread(
+                self._search_with_ddgs, query, categories, max_results, time_range, page
+            )
+            answered = True
+
+        if answered:
+            self._store(key, result)
+        return result
+
+    async def aforward_many(self, queries: List[str], **kwargs: Any) -> List[str]:
+        """Run several searches concurrently; results are in query order."""
+        return list(
+            await asyncio.gather(*(self.aforward(query, **kwargs) for query in queries))
+        )
+
+    def invalidate(self) -> None:
+        """Drop all cached search results."""
+        self._cache.clear()
+
+    def _cache_key(
+        self,
+        query: str,
+        categories: Optional[str],
+        max_results: Optional[int],
+        time_range: Optional[str],
+        page: Optional[int],
+    ) -> Tuple:
+        """
+        Cache key; includes the configured provider so entries never cross
+        providers. Results from the DDGS fallback are not cached under it.
+        """
+        provider = "searxng" if self.use_searxng else "ddgs"
+        return (provider, query, categories, max_results, time_range, page)
+
+    def _store(self, key: Tuple, result: str) -> None:
+        """Cache a search result unless it reports a failure."""
+        if not result.startswith("Error"):
+            self._cache.put(key, result)
+
+    def _get_ddgs(self):
+        """Get the shared DDGS instance, creating it on first use."""
+        if self._ddgs is None:
+            with self._ddgs_lock:
+                if self._ddgs is None:
+                    # Lazy import to avoid loading unless needed
+                    from ddgs import DDGS
+
+                    self._ddgs = DDGS()
+        return self._ddgs
+
+    @classmethod
+    def _timelimit(cls, time_range: Optional[str]) -> Optional[str]:
+        """Map a time range such as "week" to the DDGS timelimit code."""
+        if not time_range:
+            return None
+        timelimit = cls._TIME_LIMITS.get(time_range)
+        if timelimit is None:
+            timelimit = cls.TIME_RANGE_MAPPING.get(time_range.lower())
+        return timelimit
 
     def _search_with_ddgs(
         self,
@@ -139,9 +364,7 @@ class WebSearchTool(Tool):
         page: Optional[int] = 1,
     ) -> str:
         """Perform search using DuckDuckGo."""
-        timelimit = (
-            self.TIME_RANGE_MAPPING.get(time_range.lower()) if time_range else None
-        )
+        timelimit = self._timelimit(time_range)
 
         # Max results validation
         max_results = max_results if max_results else 10
@@ -150,43 +373,37 @@ class WebSearchTool(Tool):
             max_results = 20  # Cap to reasonable limit
 
         try:
-            # Lazy import to avoid loading unless needed
-            from ddgs import DDGS
-
-            # Use context manager for better resource management
-            with DDGS() as ddgs:
-                results = []
-                source_label = f"DDGS ({category or 'general'})"
-
-                if not category or category == "general":
-                    # Text Search (supports backend='api', 'html', 'lite') - 'api' is default
-                    # Note: DDGS.text() doesn't strictly support pagination in the API backend consistently across versions,
-                    # but we can simulate or pass parameters if supported.
-                    # For simplicity, we stick to basic arguments.
-                    results = list(
-                        ddgs.text(query, timelimit=timelimit, max_results=max_results)
-                    )
-                elif category == "news":
-                    results = list(
-                        ddgs.news(query, timelimit=timelimit, max_results=max_results)
-                    )
-                elif category == "images":
-                    results = list(
-                        ddgs.images(query, timelimit=timelimit, max_results=max_results)
-                    )
-                elif category == "videos":
-                    results = list(
-                        ddgs.videos(query, timelimit=timelimit, max_results=max_results)
-                    )
-                else:
-                    return f"Error: Unsupported category '{category}' for DuckDuckGo."
-
-                if not results:
-                    return f"No results found for query: '{query}'"
-
-                return self._format_results(
-                    results, source=source_label, category=category
+            ddgs = self._get_ddgs()
+            results = []
+            source_label = f"DDGS ({category or 'general'})"
+
+            if not category or category == "general":
+                # Text Search (supports backend='api', 'html', 'lite') - 'api' is default
+                # Note: DDGS.text() doesn't strictly support pagination in the API backend consistently across versions,
+                # but we can simulate or pass parameters if supported.
+                # For simplicity, we stick to basic arguments.
+                results = list(
+                    ddgs.text(query, timelimit=timelimit, max_results=max_results)
                 )
+            elif category == "news":
+                results = list(
+                    ddgs.news(query, timelimit=timelimit, max_results=max_results)
+                )
+            elif category == "images":
+                results = list(
+                    ddgs.images(query, timelimit=timelimit, max_results=max_results)
+                )
+            elif category == "videos":
+                results = list(
+                    ddgs.videos(query, timelimit=timelimit, max_results=max_results)
+                )
+            else:
+                return f"Error: Unsupported category '{category}' for DuckDuckGo."
+
+            if not results:
+                return f"No results found for query: '{query}'"
+
+            return self._format_results(results, source=source_label, category=category)
 
         except Exception as e:
             logger.error(f"DDGS search failed: {e}")
@@ -199,68 +416,133 @@ class WebSearchTool(Tool):
         max_results: Optional[int] = 10,
         time_range: Optional[str] = None,
         page: Optional[int] = 1,
-    ) -> str:
-        """Perform a search using SearXNG instance."""
-        try:
-            params = {
-                "q": query,
-                "format": "json",
-                "page": page or 1,
-            }
-
-            if categories:
-                params["categories"] = categories
-
-            if time_range:
-                params["time_range"] = time_range
-
-            response = self.client.get("/search", params=params)
-
-            if response.status_code == 403:
-                logger.warning("SearXNG JSON format restricted, falling back to DDGS")
-                # Pass defaults for new params since searxng function signature is older
-                return self._search_with_ddgs(
-                    query,
-                    category=categories,
-                    max_results=max_results,
-                    time_range=time_range,
-                    page=page,
-                )
-
-            response.raise_for_status()
-
-            try:
-                data = json.loads(response.text)
-                return self._format_results(
-                    data.get("results", []),
-                    source="SearXNG",
-                    query=data.get("query", query),
-                )
-            except json.JSONDecodeError:
-                return response.text
+    ) -> Tuple[str, bool]:
+        """
+        Perform a search using SearXNG instance.
 
-        except httpx.HTTPStatusError as e:
-            logger.warning(
-                f"SearXNG failed with {e.response.status_code}. Falling back to DDGS."
+        Returns:
+            The result, and whether SearXNG produced it (False when the
+            result came from the DDGS fallback)
+        """
+        try:
+            response = self.client.get(
+                "/search",
+                params=self._build_params(query, categories, time_range, page),
             )
-            return self._search_with_ddgs(
+            result = self._searxng_result(response, query, max_results)
+        except Exception as e:
+            self._log_searxng_failure(e)
+            result = None
+
+        if result is None:
+            fallback = self._search_with_ddgs(
                 query,
                 category=categories,
                 max_results=max_results,
                 time_range=time_range,
                 page=page,
             )
+            return fallback, False
+        return result, True
 
-        except (httpx.RequestError, Exception) as e:
-            logger.warning(
-                f"SearXNG connection failed: {str(e)}. Falling back to DDGS."
+    async def _asearch_with_searxng(
+        self,
+        query: str,
+        categories: Optional[str] = None,
+        max_results: Optional[int] = 10,
+        time_range: Optional[str] = None,
+        page: Optional[int] = 1,
+    ) -> Tuple[str, bool]:
+        """Async variant of _search_with_searxng."""
+        try:
+            client = await self._ensure_aclient()
+            response = await client.get(
+                "/search",
+                params=self._build_params(query, categories, time_range, page),
             )
-            return self._search_with_ddgs(
+            result = self._searxng_result(response, query, max_results)
+        except Exception as e:
+            self._log_searxng_failure(e)
+            result = None
+
+        if result is None:
+            fallback = await asyncio.to_thread(
+                self._search_with_ddgs,
                 query,
-                category=categories,
-                max_results=max_results,
-                time_range=time_range,
-                page=page,
+                categories,
+                max_results,
+                time_range,
+                page,
+            )
+            return fallback, False
+        return result, True
+
+    @staticmethod
+    def _build_params(
+        query: str,
+        categories: Optional[str],
+        time_range: Optional[str],
+        page: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build SearXNG query parameters."""
+        params = {
+            "q": query,
+            "format": "json",
+            "page": page or 1,
+        }
+
+        if categories:
+            params["categories"] = categories
+
+        if time_range:
+            params["time_range"] = time_range
+
+        return params
+
+    def _searxng_result(
+        self, response: httpx.Response, query: str, max_results: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Format a SearXNG response.
+
+        Returns:
+            The formatted results, or None if the search should fall back to DDGS
+
+        Raises:
+            httpx.HTTPStatusError: If SearXNG returned an error status
+        """
+        if response.status_code == 403:
+            logger.warning("SearXNG JSON format restricted, falling back to DDGS")
+            return None
+
+        response.raise_for_status()
+
+        try:
+            data = json.loads(response.content)
+        except json.JSONDecodeError:
+            return response.text
+
+        results = data.get("results", [])
+        if max_results:
+            # Only format what the caller asked for; SearXNG pages can be large
+            results = results[:max_results]
+
+        return self._format_results(
+            results,
+            source="SearXNG",
+            query=data.get("query", query),
+        )
+
+    @staticmethod
+    def _log_searxng_failure(error: Exception) -> None:
+        """Log why a SearXNG search is falling back to DDGS."""
+        if isinstance(error, httpx.HTTPStatusError):
+            logger.warning(
+                f"SearXNG failed with {error.response.status_code}. Falling back to DDGS."
+            )
+        else:
+            logger.warning(
+                f"SearXNG connection failed: {str(error)}. Falling back to DDGS."
             )
 
     def _format_results(
@@ -276,56 +558,47 @@ class WebSearchTool(Tool):
         if not results:
             return "No results found."
 
+        fields = self._CATEGORY_FIELDS.get(category, _default_fields)
         output = [f"# Search Results (via {source})\n"]
 
         for i, result in enumerate(results, 1):
-            # Normalize fields based on category/source
-
-            # Common defaults
             title = result.get("title", "No title")
-            url = result.get("url") or result.get("href") or ""
-            content = result.get("content") or result.get("body") or ""
-
-            # Special handling for Images/Videos/News fields if distinct
-            if category == "images":
-                # DDGS images: 'title', 'image', 'thumbnail', 'url', 'height', 'width', 'source'
-                image_url = result.get("image", "")
-                thumbnail = result.get("thumbnail", "")
-                url = result.get("url")  # Page URL
-                content = f"Image: {image_url}\nThumbnail: {thumbnail}"
-            elif category == "videos":
-                # DDGS videos: 'title', 'content', 'embed_url', 'deputy_id', 'description', 'images', 'uploader', 'duration', 'published'
-                description = result.get("description", "")
-                uploader = result.get("uploader", "")
-                duration = result.get("duration", "")
-                content = f"{description}\nUploader: {uploader} | Duration: {duration}"
-            elif category == "news":
-                # DDGS news: 'date', 'title', 'body', 'url', 'image', 'source'
-                date = result.get("date", "")
-                source_news = result.get("source", "")
-                content = f"{content}\nDate: {date} | Source: {source_news}"
+            url, content = fields(result)
 
-            engines = result.get("engines", [])
-
-            # Clean content if string
             if isinstance(content, str):
-                content = " ".join(content.split())
-                if len(content) > 300:  # Allow slightly more context
-                    content = content[:297] + "..."
+                content = _clean_description(content)
 
-            output.append(f"## {i}. {title}")
-            output.append(f"**URL:** {url}")
-            output.append(f"**Description:** {content}")
+            entry = f"## {i}. {title}\n**URL:** {url}\n**Description:** {content}\n"
+            engines = result.get("engines")
             if engines:
-                output.append(f"**Sources:** {', '.join(engines)}")
-            output.append("")
+                entry += f"**Sources:** {', '.join(engines)}\n"
+            output.append(entry)
 
         return "\n".join(output)
 
-    def __del__(self):
-        """Clean up HTTP client."""
-        if self.client:
+    async def aclose(self):
+        """Close the async HTTP client, if one was created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def close(self) -> None:
+        """Close the sync HTTP client; safe to call more than once."""
+        with self._client_lock:
+            client, self.client = self.client, None
+        if client is not None:
             try:
-                self.client.close()
+                client.close()
             except Exception:
                 pass
+
+    def __enter__(self) -> "WebSearchTool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        """Clean up HTTP client on garbage collection."""
+        if hasattr(self, "_client_lock"):
+            self.close()
@@ -2,6 +2,10 @@
 WriteFileTool - Create or overwrite files.
 """
 
+import os
+import stat
+import uuid
+from pathlib import Path
 from typing import Optional
 
 from smolagents.tools import Tool
@@ -9,9 +13,35 @@ from smolagents.tools import Tool
 from suzent.logger import get_logger
 from suzent.tools.path_resolver import PathResolver
 
+__tools__ = ("WriteFileTool",)
+
 logger = get_logger(__name__)
 
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write data to path via a sibling temp file and os.replace.
+
+    Readers see either the old file or the new one, never a partial write.
+    The temp file is removed if anything fails.
+    """
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    # O_EXCL with 0o666 lets the umask decide permissions, as open() would
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            # Keep the permissions of a file being overwritten
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 class WriteFileTool(Tool):
     """
     Create or overwrite a file with given content.
@@ -59,18 +89,19 @@ Examples:
             # Resolve the path
             resolved_path = self._resolver.resolve(file_path)
 
-            # Create parent directories if needed
-            resolved_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Check if file exists (for logging)
             existed = resolved_path.exists()
 
-            # Write the content
-            with open(resolved_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Create parent directories if needed; an existing file implies them
+            if not existed:
+                resolved_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Encode once and write the bytes as-is (no newline translation)
+            data = content.encode("utf-8")
+            _atomic_write(resolved_path, data)
 
             action = "Overwrote" if existed else "Created"
-            size = len(content)
+            size = len(data)
             logger.info(f"{action} file: {file_path} ({size} bytes)")
 
             return f"{action} file: {file_path} ({size} bytes written)"
@@ -1,31 +1,29 @@
 """Shared pytest fixtures and configuration."""
 
-import os
-import tempfile
 import uuid
 
 import pytest
+from sqlmodel import SQLModel
 
-from suzent.database import ChatDatabase
+from suzent.database import MEMORY_DB, ChatDatabase
 
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-
-    database = ChatDatabase(db_path)
+@pytest.fixture(scope="session")
+def _shared_db():
+    """One in-memory database, schema built once for the whole run."""
+    database = ChatDatabase(MEMORY_DB)
     yield database
-
-    # Dispose engine to release file locks (Windows)
     database.engine.dispose()
 
-    # Cleanup
-    try:
-        os.unlink(db_path)
-    except PermissionError:
-        pass
+
+@pytest.fixture
+def temp_db(_shared_db):
+    """Provide an empty database for testing; tables are cleared afterwards."""
+    yield _shared_db
+
+    with _shared_db.engine.begin() as conn:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            conn.execute(table.delete())
 
 
 @pytest.fixture
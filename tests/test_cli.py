@@ -0,0 +1,67 @@
+"""
+Unit tests for CLI process helpers.
+
+Coverage:
+    - Stopping a child process group, including grandchildren
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from suzent.cli import stop_process_group
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="process groups are POSIX-only"
+)
+
+
+def _spawn(script: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    )
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        # An orphan that init has not reaped yet is a zombie, not running
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split()[2] != "Z"
+    except OSError:
+        return True
+
+
+class TestStopProcessGroup:
+    def test_stops_child_and_grandchild(self):
+        proc = _spawn(
+            "import subprocess, sys, time\n"
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+            "print(child.pid, flush=True)\n"
+            "time.sleep(60)\n"
+        )
+        grandchild_pid = int(proc.stdout.readline())
+
+        stop_process_group(proc, timeout=5)
+
+        assert proc.returncode is not None
+        deadline = time.monotonic() + 5
+        while _alive(grandchild_pid):
+            if time.monotonic() > deadline:
+                pytest.fail("grandchild still running")
+            time.sleep(0.05)
+
+    def test_ignores_exited_process(self):
+        proc = _spawn("pass")
+        proc.wait()
+        stop_process_group(proc)
+        assert proc.returncode == 0
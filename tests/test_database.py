@@ -1,5 +1,7 @@
 """Unit tests for SQLModel database layer."""
 
+import threading
+
 import pytest
 
 from suzent.database import ChatSummaryModel, PlanModel, UserPreferencesModel
@@ -51,9 +53,13 @@ class TestChatOperations:
         assert db.get_chat(chat_id) is None
 
     def test_list_chats(self, db):
-        db.create_chat("Chat 1", {})
-        db.create_chat("Chat 2", {})
-        db.create_chat("Chat 3", {})
+        db.create_chats(
+            [
+                {"title": "Chat 1", "config": {}},
+                {"title": "Chat 2", "config": {}},
+                {"title": "Chat 3", "config": {}},
+            ]
+        )
 
         chats = db.list_chats()
         assert len(chats) == 3
@@ -61,12 +67,36 @@ class TestChatOperations:
         assert isinstance(chats[0], ChatSummaryModel)
 
     def test_get_chat_count(self, db):
-        db.create_chat("Chat 1", {})
-        db.create_chat("Chat 2", {})
+        db.create_chats(
+            [{"title": "Chat 1", "config": {}}, {"title": "Chat 2", "config": {}}]
+        )
 
         count = db.get_chat_count()
         assert count == 2
 
+    def test_create_chats(self, db):
+        chat_ids = db.create_chats(
+            [
+                {"title": "First", "config": {"model": "gpt-4"}},
+                {"title": "Second", "config": {}, "chat_id": "fixed-id"},
+            ]
+        )
+
+        assert len(chat_ids) == 2
+        assert chat_ids[1] == "fixed-id"
+        assert db.get_chat(chat_ids[0]).config == {"model": "gpt-4"}
+        assert db.get_chat("fixed-id").title == "Second"
+
+    def test_memory_db_is_shared_across_threads(self, db):
+        chat_id = db.create_chat("Threaded", {})
+        seen = []
+
+        thread = threading.Thread(target=lambda: seen.append(db.get_chat(chat_id)))
+        thread.start()
+        thread.join()
+
+        assert seen[0] is not None
+
 
 class TestPlanOperations:
     """Tests for plan and task CRUD operations."""
@@ -81,6 +111,26 @@ class TestPlanOperations:
         )
         assert plan_id is not None
 
+    def test_create_plan_replaces_existing_tasks(self, db):
+        chat_id = db.create_chat("Test Chat", {})
+        plan_id = db.create_plan(
+            chat_id,
+            "First",
+            [
+                {"number": 1, "description": "Old 1"},
+                {"number": 2, "description": "Old 2"},
+            ],
+        )
+
+        assert (
+            db.create_plan(chat_id, "Second", [{"number": 1, "description": "New"}])
+            == plan_id
+        )
+
+        plan = db.get_plan(chat_id)
+        assert plan.objective == "Second"
+        assert [t.description for t in plan.tasks] == ["New"]
+
     def test_get_plan(self, db):
         chat_id = db.create_chat("Test Chat", {})
         db.create_plan(
@@ -114,6 +164,33 @@ class TestPlanOperations:
         assert plan.tasks[0].status == "completed"
         assert plan.tasks[0].note == "Done!"
 
+    def test_update_task_statuses(self, db):
+        chat_id = db.create_chat("Test Chat", {})
+        plan_id = db.create_plan(
+            chat_id,
+            "Objective",
+            [
+                {"number": 1, "description": "Step 1", "status": "in_progress"},
+                {"number": 2, "description": "Step 2"},
+                {"number": 3, "description": "Step 3"},
+            ],
+        )
+
+        before = db.get_plan(chat_id).updated_at
+
+        updated = db.update_task_statuses(
+            plan_id, {1: "completed", 2: "in_progress", 99: "completed"}
+        )
+        assert updated == 2
+
+        plan = db.get_plan(chat_id)
+        assert plan.updated_at > before
+        assert [t.status for t in plan.tasks] == [
+            "completed",
+            "in_progress",
+            "pending",
+        ]
+
     def test_delete_plan(self, db):
         chat_id = db.create_chat("Test Chat", {})
         db.create_plan(chat_id, "Objective", [])
@@ -166,9 +243,7 @@ class TestMCPServers:
         )
         assert result is True
 
-        servers = db.get_mcp_servers()
-        # Find the server in list
-        server = next((s for s in servers if s.name == "test-server"), None)
+        server = db.get_mcp_server("test-server")
         assert server is not None
         assert server.type == "url"
         assert server.url == "http://localhost:8080"
@@ -180,8 +255,7 @@ class TestMCPServers:
         )
         assert result is True
 
-        servers = db.get_mcp_servers()
-        server = next((s for s in servers if s.name == "stdio-server"), None)
+        server = db.get_mcp_server("stdio-server")
         assert server is not None
         assert server.type == "stdio"
         assert server.command == "node"
@@ -192,9 +266,7 @@ class TestMCPServers:
         )
         assert db.remove_mcp_server("to-remove") is True
 
-        servers = db.get_mcp_servers()
-        server = next((s for s in servers if s.name == "to-remove"), None)
-        assert server is None
+        assert db.get_mcp_server("to-remove") is None
 
     def test_toggle_server_enabled(self, db):
         db.add_mcp_server(
@@ -202,11 +274,13 @@ class TestMCPServers:
         )
 
         db.set_mcp_server_enabled("toggle-test", False)
-        servers = db.get_mcp_servers()
-        server = next(s for s in servers if s.name == "toggle-test")
-        assert server.enabled is False
+        assert db.get_mcp_server("toggle-test").enabled is False
 
         db.set_mcp_server_enabled("toggle-test", True)
-        servers = db.get_mcp_servers()
-        server = next(s for s in servers if s.name == "toggle-test")
-        assert server.enabled is True
+        assert db.get_mcp_server("toggle-test").enabled is True
+
+    def test_get_mcp_servers_lists_all(self, db):
+        db.add_mcp_server("a", config={"type": "url", "url": "http://a"})
+        db.add_mcp_server("b", config={"type": "stdio", "command": "node"})
+
+        assert sorted(s.name for s in db.get_mcp_servers()) == ["a", "b"]
@@ -1,61 +1,72 @@
+import random
+
 import pytest
 import pytest_asyncio
-import shutil
-import os
+from suzent.memory import lancedb_store
 from suzent.memory.lancedb_store import LanceDBMemoryStore
 
 from suzent.config import CONFIG
 
 # Test Data
-TEST_URI = ".suzent/test_data/memory"
 # Ensure we match the config dimension which is now likely 3072 based on default.yaml
 # We'll use the value from config to be consistent with the store's definition
 TEST_EMBEDDING = [0.1] * CONFIG.embedding_dimension
+# A clearly different vector, for ranking checks
+OTHER_EMBEDDING = [0.9] * CONFIG.embedding_dimension
+
+
+# One store (and one Lance dataset open) for the whole module; tests are
+# isolated by user_id instead of rebuilding the dataset each time
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
-@pytest_asyncio.fixture
-async def store():
-    # Setup
-    if os.path.exists(TEST_URI):
-        shutil.rmtree(TEST_URI)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def store(tmp_path_factory):
+    # Setup: a fresh directory per run (and per xdist worker)
+    uri = str(tmp_path_factory.mktemp("memory"))
 
-    s = LanceDBMemoryStore(uri=TEST_URI, embedding_dim=CONFIG.embedding_dimension)
+    s = LanceDBMemoryStore(uri=uri, embedding_dim=CONFIG.embedding_dimension)
     await s.connect()
     yield s
     # Teardown
     await s.close()
-    if os.path.exists(TEST_URI):
-        shutil.rmtree(TEST_URI)
 
 
-@pytest.mark.asyncio
-async def test_memory_block_crud(store):
+@pytest_asyncio.fixture(loop_scope="module")
+async def user_id(store, request):
+    """A user_id unique to the test; its rows are removed afterwards."""
+    uid = f"u-{request.node.name}"
+    yield uid
+    await store.delete_all_memories(uid)
+    await store.delete_all_memory_blocks(uid)
+
+
+async def test_memory_block_crud(store, user_id):
     # Set
-    await store.set_memory_block("persona", "I am a bot", user_id="user1")
+    await store.set_memory_block("persona", "I am a bot", user_id=user_id)
 
     # Get specific
-    content = await store.get_memory_block("persona", user_id="user1")
+    content = await store.get_memory_block("persona", user_id=user_id)
     assert content == "I am a bot"
 
-    # Get global (should be None if we set it for user1)
+    # Get global (should be None if we set it for this user)
     # Wait, my logic allows fallback? No, existing logic is strict match on (chat_id or null).
-    # If I ask for user_id=None, I shouldn't get user_id='user1' block.
+    # If I ask for user_id=None, I shouldn't get this user's block.
     content_global = await store.get_memory_block("persona")
     assert content_global is None
 
     # Update
-    await store.set_memory_block("persona", "I am updated", user_id="user1")
-    content_updated = await store.get_memory_block("persona", user_id="user1")
+    await store.set_memory_block("persona", "I am updated", user_id=user_id)
+    content_updated = await store.get_memory_block("persona", user_id=user_id)
     assert content_updated == "I am updated"
 
 
-@pytest.mark.asyncio
-async def test_archival_memory_crud(store):
+async def test_archival_memory_crud(store, user_id):
     # Add
     mem_id = await store.add_memory(
         content="This is a test memory",
         embedding=TEST_EMBEDDING,
-        user_id="user1",
+        user_id=user_id,
         metadata={"source": "test"},
         importance=0.8,
     )
@@ -63,7 +74,7 @@ async def test_archival_memory_crud(store):
 
     # Search
     results = await store.semantic_search(
-        query_embedding=TEST_EMBEDDING, user_id="user1", limit=5
+        query_embedding=TEST_EMBEDDING, user_id=user_id, limit=5
     )
     assert len(results) == 1
     assert results[0]["content"] == "This is a test memory"
@@ -74,38 +85,96 @@ async def test_archival_memory_crud(store):
 
     # Verify update
     results = await store.semantic_search(
-        query_embedding=TEST_EMBEDDING, user_id="user1"
+        query_embedding=TEST_EMBEDDING, user_id=user_id
     )
     assert results[0]["content"] == "Updated content"
 
     # Delete
     await store.delete_memory(mem_id)
     results = await store.semantic_search(
-        query_embedding=TEST_EMBEDDING, user_id="user1"
+        query_embedding=TEST_EMBEDDING, user_id=user_id
     )
     assert len(results) == 0
 
 
-@pytest.mark.asyncio
-async def test_hybrid_search(store):
+async def test_hybrid_search(store, user_id):
     # Add two memories
     await store.add_memory(
         content="The apple is red",
-        embedding=[0.1] * CONFIG.embedding_dimension,
-        user_id="user1",
+        embedding=TEST_EMBEDDING,
+        user_id=user_id,
     )
     await store.add_memory(
         content="The banana is yellow",
-        embedding=[0.9] * CONFIG.embedding_dimension,  # Different vector
-        user_id="user1",
+        embedding=OTHER_EMBEDDING,
+        user_id=user_id,
     )
 
     # Search for "apple"
     results = await store.hybrid_search(
-        query_embedding=[0.1] * CONFIG.embedding_dimension,  # Matches apple vector
+        query_embedding=TEST_EMBEDDING,  # Matches apple vector
         query_text="apple",
-        user_id="user1",
+        user_id=user_id,
     )
 
     assert len(results) >= 1
     assert "apple" in results[0]["content"]
+
+
+async def test_ann_index_below_threshold(store):
+    assert await store.ensure_ann_index() is False
+
+
+def _ann_vector(i: int, dim: int) -> list[float]:
+    """Deterministic random row vector; PQ can only approximate these."""
+    rng = random.Random(i)
+    return [rng.gauss(0.0, 1.0) for _ in range(dim)]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    return dot / (sum(x * x for x in a) ** 0.5 * sum(y * y for y in b) ** 0.5)
+
+
+@pytest.mark.slow
+async def test_ann_index_built_in_background_and_refined(tmp_path, monkeypatch):
+    monkeypatch.setattr(lancedb_store, "ANN_INDEX_MIN_ROWS", 300)
+    dim = CONFIG.embedding_dimension
+    s = LanceDBMemoryStore(uri=str(tmp_path), embedding_dim=dim)
+    await s.connect()
+
+    # One batched add; add_memory per row would write 300 table versions
+    now = lancedb_store._utc_now()
+    await s.archival_table.add(
+        [
+            lancedb_store.ArchivalMemoryModel(
+                id=str(i),
+                content=f"memory {i}",
+                vector=_ann_vector(i, dim),
+                user_id="ann",
+                metadata="{}",
+                importance=0.5,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(300)
+        ]
+    )
+    await s.close()
+
+    # Reconnecting schedules the build instead of running it inside connect()
+    s = LanceDBMemoryStore(uri=str(tmp_path), embedding_dim=dim)
+    await s.connect()
+    assert await s._index_task is True
+    indices = await s.archival_table.list_indices()
+    assert any("vector" in index.columns for index in indices)
+
+    # Refined results carry exact distances rather than PQ approximations
+    query = _ann_vector(5, dim)
+    results = await s.semantic_search(query, user_id="ann", limit=13)
+    assert len(results) == 13
+    assert results[0]["id"] == "5"
+    for r in results:
+        expected = _cosine(query, _ann_vector(int(r["id"]), dim))
+        assert r["similarity"] == pytest.approx(expected, abs=1e-5)
+    await s.close()
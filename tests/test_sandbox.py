@@ -44,6 +44,28 @@ pytestmark = pytest.mark.sandbox
 # =============================================================================
 
 
+def wait_until(predicate, timeout: float = 5.0, interval: float = 0.05) -> bool:
+    """Poll predicate until it is true or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
+
+
+def wait_stopped(
+    manager: SandboxManager, session_id: str, timeout: float = 2.0
+) -> bool:
+    """
+    Wait until the server no longer reports the session's sandbox.
+
+    Returns as soon as the stop has landed instead of sleeping a fixed time.
+    """
+    probe = manager._create_session(session_id)
+    return wait_until(lambda: not probe.verify_running(), timeout=timeout)
+
+
 @pytest.fixture(scope="module")
 def server_url():
     """Get sandbox server URL."""
@@ -52,14 +74,45 @@ def server_url():
     return CONFIG.sandbox_server_url or Defaults.SERVER_URL
 
 
-@pytest.fixture
-def manager():
-    """Create a fresh SandboxManager for each test."""
+@pytest.fixture(scope="module")
+def rpc(server_url):
+    """One pooled RPCClient shared by the connectivity tests."""
+    client = RPCClient(server_url, timeout=10.0)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def sandbox_server(server_url):
+    """Probe the server once per module so a missing server fails fast."""
+    if not check_server_status(server_url):
+        pytest.fail(f"Sandbox server not running at {server_url}")
+    return server_url
+
+
+@pytest.fixture(scope="module")
+def _shared_manager():
+    """One SandboxManager (and RPC connection pool) per module."""
     mgr = SandboxManager()
     yield mgr
     mgr.cleanup_all()
 
 
+@pytest.fixture(scope="module")
+def executor():
+    """One worker pool shared by the concurrency tests."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+        yield ex
+
+
+@pytest.fixture
+def manager(_shared_manager):
+    """Shared SandboxManager; sessions a test starts are stopped after it."""
+    yield _shared_manager
+    for sid in list(_shared_manager._sessions):
+        _shared_manager.stop_session(sid)
+
+
 @pytest.fixture
 def session_id(unique_id):
     """Generate unique session ID for each test."""
@@ -79,26 +132,25 @@ class TestConnectivity:
         is_running = check_server_status(server_url)
         assert is_running, f"Sandbox server not running at {server_url}"
 
-    def test_rpc_client_basic_call(self, server_url):
+    def test_rpc_client_basic_call(self, rpc):
         """Test basic RPC call to server."""
-        rpc = RPCClient(server_url, timeout=10.0)
         response = rpc.call("sandbox.metrics.get", {"namespace": "*"})
 
         # Should not have error key if server is responding
         assert "error" not in response, f"RPC call failed: {response.get('error')}"
 
-    def test_rpc_client_invalid_method(self, server_url):
+    def test_rpc_client_invalid_method(self, rpc):
         """Test RPC client handles invalid methods gracefully."""
-        rpc = RPCClient(server_url, timeout=10.0)
         response = rpc.call("invalid.method.name", {})
 
         # Should return an error, not crash
         assert isinstance(response, dict)
 
-    def test_rpc_client_timeout_handling(self, server_url):
+    def test_rpc_client_timeout_handling(self, rpc):
         """Test RPC client handles very short timeouts."""
-        rpc = RPCClient(server_url, timeout=0.001)  # 1ms timeout
-        response = rpc.call("sandbox.metrics.get", {"namespace": "*"})
+        response = rpc.call(
+            "sandbox.metrics.get", {"namespace": "*"}, timeout=0.001
+        )  # 1ms timeout
 
         # Should handle timeout gracefully
         assert isinstance(response, dict)
@@ -146,7 +198,7 @@ class TestSessionLifecycle:
 
         # Stop
         manager.stop_session(session_id)
-        time.sleep(1)  # Allow cleanup
+        wait_stopped(manager, session_id, timeout=1.0)  # Allow cleanup
 
         # Restart
         success = manager.start_session(session_id)
@@ -257,7 +309,7 @@ class TestConcurrency:
             f"Sequential executions failed: {[r.error for r in failures]}"
         )
 
-    def test_concurrent_executions_same_session(self, manager, session_id):
+    def test_concurrent_executions_same_session(self, manager, session_id, executor):
         """
         Concurrent executions in the same session.
 
@@ -269,9 +321,8 @@ class TestConcurrency:
             result = manager.execute(session_id, f"print('concurrent-{i}')")
             return (i, result)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(execute_code, i) for i in range(5)]
-            results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        futures = [executor.submit(execute_code, i) for i in range(5)]
+        results = [f.result() for f in concurrent.futures.as_completed(futures)]
 
         failures = [(i, r) for i, r in results if not r.success]
         success_rate = (len(results) - len(failures)) / len(results)
@@ -286,7 +337,7 @@ class TestConcurrency:
             for i, r in failures[:3]:
                 print(f"  - Execution {i}: {r.error}")
 
-    def test_concurrent_sessions_different_ids(self, manager):
+    def test_concurrent_sessions_different_ids(self, manager, executor):
         """Multiple concurrent sessions with different IDs."""
         session_ids = [f"concurrent-{uuid.uuid4().hex[:8]}" for _ in range(3)]
 
@@ -297,9 +348,8 @@ class TestConcurrency:
             except Exception as e:
                 return (sid, False, str(e))
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [executor.submit(run_session, sid) for sid in session_ids]
-            results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        futures = [executor.submit(run_session, sid) for sid in session_ids]
+        results = [f.result() for f in concurrent.futures.as_completed(futures)]
 
         failures = [(sid, err) for sid, success, err in results if not success]
         assert len(failures) == 0, f"Concurrent sessions failed: {failures}"
@@ -369,7 +419,7 @@ class TestStress:
                     failures.append(f"Execute {i} failed: {result.error}")
 
                 manager.stop_session(session_id)
-                time.sleep(0.5)  # Brief pause between cycles
+                wait_stopped(manager, session_id, timeout=0.5)  # Let the stop settle
 
             except Exception as e:
                 failures.append(f"Cycle {i} exception: {e}")
@@ -441,24 +491,29 @@ print('done')
 class TestErrorHandling:
     """Tests for error handling and auto-healing."""
 
-    def test_syntax_error_recovery(self, manager, session_id):
-        """Session should recover from syntax errors."""
-        # Cause syntax error (use invalid syntax that doesn't trigger continuation prompt)
-        result1 = manager.execute(session_id, "a = 1 2")
-        assert not result1.success, "Syntax error should fail"
-
-        # Should still work after
-        result2 = manager.execute(session_id, "print('recovered')")
-        assert result2.success, f"Recovery failed: {result2.error}"
-
-    def test_exception_recovery(self, manager, session_id):
-        """Session should recover from runtime exceptions."""
-        # Cause exception
-        result1 = manager.execute(session_id, "raise ValueError('test')")
-        assert not result1.success, "Exception should fail"
+    @pytest.fixture(scope="class")
+    def recovery_session(self, _shared_manager):
+        """One session shared by the recovery cases, so the VM starts once."""
+        sid = f"test-{uuid.uuid4().hex[:12]}"
+        yield sid
+        _shared_manager.stop_session(sid)
+
+    @pytest.mark.parametrize(
+        "bad_code",
+        [
+            # Invalid syntax that doesn't trigger a continuation prompt
+            "a = 1 2",
+            "raise ValueError('test')",
+        ],
+        ids=["syntax_error", "exception"],
+    )
+    def test_error_recovery(self, _shared_manager, recovery_session, bad_code):
+        """Session should recover from syntax errors and runtime exceptions."""
+        result1 = _shared_manager.execute(recovery_session, bad_code)
+        assert not result1.success, "Bad code should fail"
 
         # Should still work after
-        result2 = manager.execute(session_id, "print('recovered')")
+        result2 = _shared_manager.execute(recovery_session, "print('recovered')")
         assert result2.success, f"Recovery failed: {result2.error}"
 
     def test_infinite_loop_timeout(self, manager, session_id):
@@ -527,7 +582,7 @@ class TestPersistence:
         write_code = f"with open('/persistence/restart_test.txt', 'w') as f: f.write('{unique_data}')"
         manager.execute(session_id, write_code)
         manager.stop_session(session_id)
-        time.sleep(2)
+        wait_stopped(manager, session_id, timeout=2.0)  # Allow cleanup
 
         # Restart and read
         read_code = "print(open('/persistence/restart_test.txt').read())"
@@ -658,19 +713,19 @@ class TestEdgeCases:
         result = manager.execute(session_id, code, timeout=30)
         assert result.success, f"Long code failed: {result.error}"
 
-    def test_special_characters_in_session_id(self, manager):
-        """Test session IDs with special characters."""
-        special_ids = [
+    @pytest.mark.parametrize(
+        "sid",
+        [
             "test-with-dashes",
             "test_with_underscores",
             "test.with.dots",
             "TestWithCaps",
-        ]
-
-        for sid in special_ids:
-            result = manager.execute(sid, "print('ok')")
-            assert result.success, f"Session ID '{sid}' failed: {result.error}"
-            manager.stop_session(sid)
+        ],
+    )
+    def test_special_characters_in_session_id(self, manager, sid):
+        """Test session IDs with special characters."""
+        result = manager.execute(sid, "print('ok')")
+        assert result.success, f"Session ID '{sid}' failed: {result.error}"
 
     def test_manager_reuse(self):
         """Test creating multiple managers doesn't cause issues."""
@@ -0,0 +1,68 @@
+"""
+Unit tests for SkillManager.
+
+Coverage:
+    - Skills XML rendering and its invalidation on state changes
+"""
+
+import pytest
+
+from suzent.skills.manager import SkillManager
+
+
+def _write_skill(skills_dir, name, description):
+    skill_dir = skills_dir / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\nBody of {name}\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    skills_dir = tmp_path / "skills"
+    _write_skill(skills_dir, "alpha", "First skill")
+    _write_skill(skills_dir, "beta", "Second skill")
+
+    manager = SkillManager(skills_dir=skills_dir)
+    manager.persistence_file = tmp_path / "skills.json"
+    manager.enabled_skills = set()
+    return manager
+
+
+class TestSkillsXml:
+    def test_lists_enabled_skills_only(self, manager):
+        manager.enable_skill("alpha")
+        xml = manager.get_skills_xml()
+        assert "<name>alpha</name>" in xml
+        assert "<name>beta</name>" not in xml
+
+    def test_reuses_rendered_xml(self, manager, monkeypatch):
+        manager.enable_skill("alpha")
+        first = manager.get_skills_xml()
+        monkeypatch.setattr(
+            manager, "_build_skills_xml", lambda: pytest.fail("xml rebuilt")
+        )
+        assert manager.get_skills_xml() is first
+
+    def test_toggle_invalidates_xml(self, manager):
+        manager.enable_skill("alpha")
+        manager.get_skills_xml()
+
+        manager.toggle_skill("beta")
+        assert "<name>beta</name>" in manager.get_skills_xml()
+
+        manager.disable_skill("alpha")
+        assert "<name>alpha</name>" not in manager.get_skills_xml()
+
+    def test_reload_picks_up_new_skills(self, manager, tmp_path):
+        manager.enable_skill("alpha")
+        manager.get_skills_xml()
+
+        (manager.skills_dir / "alpha").joinpath("SKILL.md").write_text(
+            "---\nname: alpha\ndescription: Updated skill\n---\nBody\n",
+            encoding="utf-8",
+        )
+        manager.reload()
+        assert "Updated skill" in manager.get_skills_xml()
@@ -0,0 +1,422 @@
+"""
+Unit tests for PathResolver.
+
+Coverage:
+    - Virtual path mapping (/persistence, /shared, /uploads, relative)
+    - Traversal rejection
+    - Resolution cache behaviour
+    - Symlink checks
+"""
+
+import shutil
+
+import pytest
+
+from suzent.tools import path_resolver
+from suzent.tools.path_resolver import PathResolver
+
+
+@pytest.fixture
+def resolver(tmp_path):
+    return PathResolver(
+        "chat-1",
+        sandbox_enabled=True,
+        sandbox_data_path=str(tmp_path / "sandbox-data"),
+        uploads_path=str(tmp_path / "uploads"),
+        workspace_root=str(tmp_path / "workspace"),
+    )
+
+
+@pytest.fixture
+def session_dir(tmp_path):
+    return (tmp_path / "sandbox-data" / "sessions" / "chat-1").resolve()
+
+
+# ==========================================================================
+# Virtual path mapping
+# ==========================================================================
+
+
+class TestResolve:
+    def test_persistence(self, resolver, session_dir):
+        assert resolver.resolve("/persistence/a.txt") == session_dir / "a.txt"
+
+    def test_persistence_root(self, resolver, session_dir):
+        assert resolver.resolve("/persistence") == session_dir
+
+    def test_relative_maps_to_persistence(self, resolver, session_dir):
+        assert resolver.resolve("notes/a.md") == session_dir / "notes" / "a.md"
+
+    def test_shared(self, resolver, tmp_path):
+        shared = (tmp_path / "sandbox-data" / "shared").resolve()
+        assert resolver.resolve("/shared/x") == shared / "x"
+
+    def test_uploads(self, resolver, session_dir):
+        assert resolver.resolve("/uploads/f.pdf") == session_dir / "uploads" / "f.pdf"
+
+    def test_uploads_dir_created_up_front(self, resolver, session_dir):
+        assert (session_dir / "uploads").is_dir()
+
+    def test_directories_created_once_per_session(self, resolver, tmp_path):
+        calls = []
+        original = path_resolver.Path.mkdir
+
+        def tracking_mkdir(self, *args, **kwargs):
+            calls.append(self)
+            return original(self, *args, **kwargs)
+
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(path_resolver.Path, "mkdir", tracking_mkdir)
+            PathResolver(
+                "chat-1",
+                sandbox_enabled=True,
+                sandbox_data_path=str(tmp_path / "sandbox-data"),
+                uploads_path=str(tmp_path / "uploads"),
+                workspace_root=str(tmp_path / "workspace"),
+            )
+        assert calls == []
+
+    def test_deleted_directories_recreated(self, resolver, session_dir, tmp_path):
+        shutil.rmtree(session_dir)
+        shutil.rmtree(session_dir.parents[1] / "shared")
+
+        PathResolver(
+            "chat-1",
+            sandbox_enabled=True,
+            sandbox_data_path=str(tmp_path / "sandbox-data"),
+            uploads_path=str(tmp_path / "uploads"),
+            workspace_root=str(tmp_path / "workspace"),
+        )
+        assert (session_dir / "uploads").is_dir()
+        assert (session_dir.parents[1] / "shared").is_dir()
+
+    def test_backslashes_normalized(self, resolver, session_dir):
+        assert resolver.resolve("\\persistence\\a\\b") == session_dir / "a" / "b"
+
+    def test_traversal_rejected(self, resolver):
+        with pytest.raises(ValueError):
+            resolver.resolve("/persistence/../../../etc/passwd")
+
+    def test_dotdot_inside_root_is_normalized(self, resolver, session_dir):
+        assert resolver.resolve("/persistence/a/../b.txt") == session_dir / "b.txt"
+
+    def test_relative_traversal_rejected(self, resolver):
+        with pytest.raises(ValueError):
+            resolver.resolve("../other-chat/secret.txt")
+
+    def test_resolve_many_preserves_order(self, resolver, session_dir):
+        paths = ["/persistence/b", "a", "\\persistence\\b"]
+        assert resolver.resolve_many(paths) == [
+            session_dir / "b",
+            session_dir / "a",
+            session_dir / "b",
+        ]
+
+    def test_resolve_many_rejects_traversal(self, resolver):
+        with pytest.raises(ValueError):
+            resolver.resolve_many(["/persistence/ok", "/shared/../../../etc"])
+
+
+# ==========================================================================
+# Custom mounts
+# ==========================================================================
+
+
+class TestCustomMounts:
+    def _resolver(self, tmp_path, volumes):
+        return PathResolver(
+            "chat-1",
+            sandbox_enabled=True,
+            sandbox_data_path=str(tmp_path / "sandbox-data"),
+            uploads_path=str(tmp_path / "uploads"),
+            custom_volumes=volumes,
+            workspace_root=str(tmp_path / "workspace"),
+        )
+
+    def test_single_mount(self, tmp_path):
+        host = tmp_path / "host"
+        resolver = self._resolver(tmp_path, [f"{host}:/mnt/data"])
+        assert resolver.resolve("/mnt/data/x.csv") == host.resolve() / "x.csv"
+        assert resolver.resolve("/mnt/data") == host.resolve()
+
+    def test_similar_prefix_is_not_a_mount(self, tmp_path, session_dir):
+        resolver = self._resolver(tmp_path, [f"{tmp_path / 'host'}:/mnt/data"])
+        assert resolver.resolve("/mnt/database") == session_dir / "mnt" / "database"
+
+    def test_nested_mount_wins(self, tmp_path):
+        outer, inner = tmp_path / "outer", tmp_path / "inner"
+        resolver = self._resolver(
+            tmp_path, [f"{outer}:/mnt/data", f"{inner}:/mnt/data/nested"]
+        )
+        assert resolver.resolve("/mnt/data/nested/f") == inner.resolve() / "f"
+        assert resolver.resolve("/mnt/data/other/f") == outer.resolve() / "other" / "f"
+
+    def test_many_mounts_use_deepest_match(self, tmp_path):
+        a, b, c = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+        resolver = self._resolver(
+            tmp_path, [f"{a}:/mnt/a", f"{b}:/mnt/a/b", f"{c}:/data/c"]
+        )
+        assert resolver.resolve("/mnt/a/b/c/d") == b.resolve() / "c" / "d"
+        assert resolver.resolve("/mnt/a/bb") == a.resolve() / "bb"
+        assert resolver.resolve("/data/c") == c.resolve()
+
+    def test_traversal_out_of_mount_rejected(self, tmp_path):
+        resolver = self._resolver(tmp_path, [f"{tmp_path / 'host'}:/mnt/data"])
+        with pytest.raises(ValueError):
+            resolver.resolve("/mnt/data/../../etc/passwd")
+
+
+# ==========================================================================
+# Resolution cache
+# ==========================================================================
+
+
+class TestResolveCache:
+    def test_repeated_lookup_hits_cache(self, resolver, session_dir):
+        first = resolver.resolve("/persistence/a.txt")
+        assert "/persistence/a.txt" in resolver._resolve_cache
+        assert resolver.resolve("/persistence/a.txt") == first
+
+    def test_lookup_does_not_canonicalize_roots(
+        self, resolver, session_dir, monkeypatch
+    ):
+        def fail(self, strict=False):
+            raise AssertionError(f"resolve() called on {self}")
+
+        monkeypatch.setattr(path_resolver.Path, "resolve", fail)
+        assert resolver.resolve("/persistence/a/b.txt") == session_dir / "a" / "b.txt"
+        assert resolver.resolve("/shared/c") == session_dir.parents[1] / "shared" / "c"
+
+    def test_cache_is_bounded(self, resolver, monkeypatch):
+        monkeypatch.setattr(path_resolver, "_RESOLVE_CACHE_SIZE", 2)
+        for name in ("a", "b", "c"):
+            resolver.resolve(f"/persistence/{name}")
+        assert list(resolver._resolve_cache) == ["/persistence/b", "/persistence/c"]
+
+    def test_symlink_swap_after_caching_is_rejected(
+        self, resolver, session_dir, tmp_path
+    ):
+        resolver.resolve("/persistence/link")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (session_dir / "link").symlink_to(outside)
+
+        with pytest.raises(ValueError):
+            resolver.resolve("/persistence/link")
+
+
+# ==========================================================================
+# Symlink handling
+# ==========================================================================
+
+
+class TestSymlinks:
+    def test_symlink_inside_root_is_followed(self, resolver, session_dir):
+        (session_dir / "real").mkdir()
+        (session_dir / "alias").symlink_to(session_dir / "real")
+
+        assert (
+            resolver.resolve("/persistence/alias/f.txt")
+            == session_dir / "real" / "f.txt"
+        )
+
+    def test_symlinked_parent_escaping_root_is_rejected(
+        self, resolver, session_dir, tmp_path
+    ):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (session_dir / "escape").symlink_to(outside)
+
+        with pytest.raises(ValueError):
+            resolver.resolve("/persistence/escape/new-file.txt")
+
+    def test_nested_symlink_escaping_root_is_rejected(
+        self, resolver, session_dir, tmp_path
+    ):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (session_dir / "a" / "b").mkdir(parents=True)
+        (session_dir / "a" / "b" / "link").symlink_to(outside)
+
+        with pytest.raises(ValueError):
+            resolver.resolve("/persistence/a/b/link/c/d.txt")
+
+    def test_symlinked_uploads_dir_escaping_root_is_rejected(
+        self, resolver, session_dir, tmp_path
+    ):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "passwd").write_text("secret")
+        (session_dir / "uploads").rmdir()
+        (session_dir / "uploads").symlink_to(outside)
+
+        with pytest.raises(ValueError):
+            resolver.resolve("/uploads/passwd")
+        with pytest.raises(ValueError):
+            resolver.resolve("/uploads")
+
+
+# ==========================================================================
+# File search
+# ==========================================================================
+
+
+class TestFindFiles:
+    @pytest.fixture
+    def mounted(self, tmp_path):
+        project = tmp_path / "project"
+        (project / "src").mkdir(parents=True)
+        (project / "src" / "main.py").write_text("")
+        (project / "README.md").write_text("")
+        return PathResolver(
+            "chat-1",
+            sandbox_enabled=True,
+            sandbox_data_path=str(tmp_path / "sandbox-data"),
+            uploads_path=str(tmp_path / "uploads"),
+            custom_volumes=[f"{project}:/mnt/project"],
+            workspace_root=str(tmp_path / "workspace"),
+        )
+
+    def test_virtual_paths_for_mount(self, mounted):
+        found = {v for _, v in mounted.find_files("**/*.py", "/mnt/project")}
+        assert found == {"/mnt/project/src/main.py"}
+
+    def test_search_all_roots(self, mounted, session_dir):
+        (session_dir / "notes.md").write_text("")
+        found = {v for _, v in mounted.find_files("*.md")}
+        assert found == {"/persistence/notes.md", "/mnt/project/README.md"}
+
+    def test_single_star_does_not_descend(self, mounted):
+        found = {v for _, v in mounted.find_files("*.py", "/mnt/project")}
+        assert found == set()
+
+    def test_symlinked_directory_not_followed(self, mounted, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.py").write_text("")
+        (tmp_path / "project" / "link").symlink_to(outside)
+
+        found = {v for _, v in mounted.find_files("**/*.py", "/mnt/project")}
+        assert found == {"/mnt/project/src/main.py"}
+
+    def test_trailing_slash_matches_directories(self, mounted):
+        found = {v for _, v in mounted.find_files("*/", "/mnt/project")}
+        assert found == {"/mnt/project/src"}
+
+    @pytest.mark.parametrize(
+        "pattern", ["*", "*/", "a/*/", "**", "a/**", "**/*.py", "a/**/", "**/b"]
+    )
+    def test_scan_glob_matches_path_glob(self, tmp_path, pattern):
+        root = tmp_path / "tree"
+        (root / "a" / "b" / "c").mkdir(parents=True)
+        (root / "d").mkdir()
+        for rel in ("top.py", "a/mid.py", "a/b/deep.py", "a/b/c/b"):
+            (root / rel).write_text("")
+
+        assert sorted(PathResolver._scan_glob(root, pattern)) == sorted(
+            root.glob(pattern)
+        )
+
+
+# ==========================================================================
+# Mount shadowing
+# ==========================================================================
+
+
+class TestIsShadowed:
+    @pytest.fixture
+    def nested(self, tmp_path):
+        return PathResolver(
+            "chat-1",
+            sandbox_enabled=True,
+            sandbox_data_path=str(tmp_path / "sandbox-data"),
+            uploads_path=str(tmp_path / "uploads"),
+            custom_volumes=[f"{tmp_path}:/mnt/data/nested"],
+            workspace_root=str(tmp_path / "workspace"),
+        )
+
+    def test_parent_of_mount(self, nested):
+        assert nested.is_shadowed("/mnt/data") is True
+
+    def test_mount_point(self, nested):
+        assert nested.is_shadowed("/mnt/data/nested") is True
+
+    def test_inside_mount(self, nested):
+        assert nested.is_shadowed("/mnt/data/nested/file.txt") is False
+
+    def test_unrelated_path(self, nested):
+        assert nested.is_shadowed("/persistence/notes.md") is False
+
+
+# ==========================================================================
+# Static helpers
+# ==========================================================================
+
+
+class TestToLinuxPath:
+    def test_unchanged_off_windows(self):
+        if path_resolver.os.name == "nt":
+            pytest.skip("POSIX-only behaviour")
+        assert PathResolver.to_linux_path("D:\\workspace") == "D:\\workspace"
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("D:\\workspace\\app", "/mnt/d/workspace/app"),
+            ("c:/Users", "/mnt/c/Users"),
+            ("/already/linux", "/already/linux"),
+            ("relative/dir", "relative/dir"),
+        ],
+    )
+    def test_windows_drive_paths(self, monkeypatch, path, expected):
+        with monkeypatch.context() as m:
+            m.setattr(path_resolver.os, "name", "nt")
+            converted = PathResolver.to_linux_path(path)
+        assert converted == expected
+
+
+class TestVirtualRoots:
+    def test_standard_roots_then_mounts_longest_first(self, tmp_path, session_dir):
+        resolver = PathResolver(
+            "chat-1",
+            sandbox_enabled=True,
+            sandbox_data_path=str(tmp_path / "sandbox-data"),
+            uploads_path=str(tmp_path / "uploads"),
+            custom_volumes=[f"{tmp_path}:/mnt/a", f"{tmp_path}:/mnt/a/deeper"],
+            workspace_root=str(tmp_path / "workspace"),
+        )
+        roots = [v for v, _ in resolver.get_virtual_roots()]
+        assert roots == ["/persistence", "/shared", "/mnt/a/deeper", "/mnt/a"]
+        assert resolver.get_virtual_roots()[0][1] == session_dir
+
+
+class TestToVirtualPath:
+    def test_persistence_file(self, resolver, session_dir):
+        assert resolver.to_virtual_path(session_dir / "a" / "b.txt") == (
+            "/persistence/a/b.txt"
+        )
+
+    def test_root_itself(self, resolver, session_dir):
+        assert resolver.to_virtual_path(session_dir) == "/persistence"
+
+    def test_trailing_dot_in_name_kept(self, resolver, session_dir):
+        assert resolver.to_virtual_path(session_dir / "file.") == ("/persistence/file.")
+
+    def test_outside_known_roots(self, resolver, tmp_path):
+        assert resolver.to_virtual_path(tmp_path / "elsewhere") is None
+
+    def test_sibling_with_shared_prefix(self, resolver, session_dir):
+        sibling = session_dir.with_name(session_dir.name + "-other") / "f.txt"
+        assert resolver.to_virtual_path(sibling) is None
+
+
+class TestIsPathAllowed:
+    def test_inside_session(self, resolver, session_dir):
+        assert resolver.is_path_allowed(session_dir / "x.txt") is True
+
+    def test_outside(self, resolver, tmp_path):
+        assert resolver.is_path_allowed(tmp_path / "elsewhere") is False
+
+    def test_sibling_with_shared_prefix(self, resolver, session_dir):
+        sibling = session_dir.with_name(session_dir.name + "-other")
+        assert resolver.is_path_allowed(sibling) is False
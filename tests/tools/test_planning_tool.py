@@ -0,0 +1,114 @@
+"""
+Unit tests for PlanningTool.
+
+Coverage:
+    - forward: action dispatch and validation
+    - update: creating and replacing a plan
+    - advance: phase transitions and error cases
+"""
+
+import pytest
+
+from suzent.tools.planning_tool import PlanningTool
+
+
+@pytest.fixture
+def db(temp_db, monkeypatch):
+    monkeypatch.setattr("suzent.plan.get_database", lambda: temp_db)
+    monkeypatch.setattr("suzent.database.get_database", lambda: temp_db)
+    return temp_db
+
+
+@pytest.fixture
+def tool(db):
+    tool = PlanningTool()
+    tool._current_chat_id = db.create_chat("Plan Chat", {})
+    return tool
+
+
+PHASES = [
+    {"id": 1, "title": "Research"},
+    {"id": 2, "title": "Build"},
+    {"id": 3, "title": "Ship"},
+]
+
+
+def _statuses(db, chat_id):
+    return [t.status for t in db.get_plan(chat_id).tasks]
+
+
+class TestUpdate:
+    def test_creates_plan_with_first_phase_in_progress(self, tool, db):
+        output = tool.forward("update", goal="Launch", phases=PHASES)
+
+        assert "Goal: Launch" in output
+        assert "Current phase: 1. Research" in output
+        assert _statuses(db, tool._current_chat_id) == [
+            "in_progress",
+            "pending",
+            "pending",
+        ]
+
+    def test_requires_phases(self, tool):
+        assert "Missing arguments" in tool.forward("update", goal="Launch")
+
+
+class TestForward:
+    def test_invalid_action(self, tool):
+        output = tool.forward("delete")
+        assert "Invalid action" in output
+        assert "Must be one of: update, advance" in output
+
+
+class TestAdvance:
+    def test_marks_skipped_phases_completed(self, tool, db):
+        tool.forward("update", goal="Launch", phases=PHASES)
+
+        output = tool.forward("advance", current_phase_id=1, next_phase_id=3)
+
+        assert "Next phase: 3. Ship" in output
+        assert _statuses(db, tool._current_chat_id) == [
+            "completed",
+            "completed",
+            "in_progress",
+        ]
+
+    def test_keeps_task_rows(self, tool, db):
+        tool.forward("update", goal="Launch", phases=PHASES)
+        task_ids = [t.id for t in db.get_plan(tool._current_chat_id).tasks]
+
+        tool.forward("advance", current_phase_id=1, next_phase_id=2)
+
+        assert [t.id for t in db.get_plan(tool._current_chat_id).tasks] == task_ids
+
+    def test_repeated_advance_skips_write(self, tool, db, monkeypatch):
+        tool.forward("update", goal="Launch", phases=PHASES)
+        tool.forward("advance", current_phase_id=1, next_phase_id=2)
+        calls = []
+        monkeypatch.setattr(
+            db, "update_task_statuses", lambda *args: calls.append(args)
+        )
+
+        output = tool.forward("advance", current_phase_id=1, next_phase_id=2)
+
+        assert "Next phase: 2. Build" in output
+        assert calls == []
+
+    def test_unknown_phase(self, tool):
+        tool.forward("update", goal="Launch", phases=PHASES)
+        output = tool.forward("advance", current_phase_id=1, next_phase_id=7)
+        assert "Invalid next_phase_id" in output
+
+    def test_unknown_current_phase(self, tool, db):
+        tool.forward("update", goal="Launch", phases=PHASES)
+        output = tool.forward("advance", current_phase_id=9, next_phase_id=2)
+        assert "Invalid current_phase_id" in output
+        assert _statuses(db, tool._current_chat_id) == [
+            "in_progress",
+            "pending",
+            "pending",
+        ]
+
+    def test_without_plan(self, tool):
+        output = tool.forward("advance", current_phase_id=1, next_phase_id=2)
+        assert "No plan exists" in output
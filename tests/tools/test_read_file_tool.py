@@ -0,0 +1,129 @@
+"""
+Unit tests for ReadFileTool.
+
+Coverage:
+    - Text files: full reads and offset/limit windows
+    - Document conversion through the shared converter
+    - Line slicing for converted documents
+"""
+
+import os
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from suzent.tools import read_file_tool
+from suzent.tools.path_resolver import PathResolver
+from suzent.tools.read_file_tool import ReadFileTool, _slice_lines
+
+
+@pytest.fixture
+def tool(tmp_path):
+    resolver = PathResolver(
+        "chat-1",
+        sandbox_enabled=True,
+        sandbox_data_path=str(tmp_path / "sandbox-data"),
+        uploads_path=str(tmp_path / "uploads"),
+        workspace_root=str(tmp_path / "workspace"),
+    )
+    tool = ReadFileTool()
+    tool.set_context(resolver)
+    return tool
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "sandbox-data" / "sessions" / "chat-1" / "notes.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 11)))
+    return "/persistence/notes.txt"
+
+
+class TestTextFiles:
+    def test_full_read(self, tool, text_file):
+        content = tool.forward(text_file)
+        assert content.startswith("line 1\n")
+        assert content.endswith("line 10\n")
+
+    def test_offset_and_limit(self, tool, text_file):
+        assert tool.forward(text_file, offset=2, limit=3) == (
+            "[Lines 3-5 of 10]\nline 3\nline 4\nline 5\n"
+        )
+
+    def test_offset_only(self, tool, text_file):
+        assert tool.forward(text_file, offset=8) == (
+            "[Lines 9-10 of 10]\nline 9\nline 10\n"
+        )
+
+    def test_limit_past_end(self, tool, text_file):
+        assert tool.forward(text_file, offset=9, limit=5) == (
+            "[Lines 10-10 of 10]\nline 10\n"
+        )
+
+    def test_offset_beyond_end(self, tool, text_file):
+        assert tool.forward(text_file, offset=10, limit=2) == (
+            "(File has 10 lines, offset 10 is beyond end)"
+        )
+
+    def test_total_counts_unterminated_last_line(self, tool, tmp_path):
+        path = tmp_path / "sandbox-data" / "sessions" / "chat-1" / "crlf.txt"
+        path.write_bytes(b"a\r\nb\r\nc\r\nd")
+        assert tool.forward("/persistence/crlf.txt", limit=1) == (
+            "[Lines 1-1 of 4]\na\n"
+        )
+
+    def test_directory_rejected(self, tool, tmp_path):
+        (tmp_path / "sandbox-data" / "sessions" / "chat-1" / "docs").mkdir()
+        assert "not a file" in tool.forward("/persistence/docs")
+
+    def test_missing_file(self, tool):
+        assert "File not found" in tool.forward("/persistence/none.txt")
+
+
+class TestConvertFile:
+    @pytest.fixture
+    def converter(self, monkeypatch):
+        calls = []
+
+        class FakeConverter:
+            def convert(self, path):
+                calls.append(path)
+                return SimpleNamespace(text_content="# Title\none\ntwo")
+
+        monkeypatch.setattr(read_file_tool, "_converter", FakeConverter())
+        monkeypatch.setattr(read_file_tool, "_convert_cache", OrderedDict())
+        return calls
+
+    @pytest.fixture
+    def document(self, tmp_path):
+        path = tmp_path / "sandbox-data" / "sessions" / "chat-1" / "report.pdf"
+        path.write_bytes(b"%PDF")
+        return "/persistence/report.pdf"
+
+    def test_converter_shared_across_instances(self, tool, document, converter):
+        other = ReadFileTool()
+        other.set_context(tool._resolver)
+
+        assert tool.forward(document) == "# Title\none\ntwo"
+        assert other.forward(document, offset=1, limit=1) == "one"
+        assert len(converter) == 1
+
+    def test_reconverts_after_change(self, tool, document, converter, tmp_path):
+        path = tmp_path / "sandbox-data" / "sessions" / "chat-1" / "report.pdf"
+        tool.forward(document)
+
+        stat_result = path.stat()
+        os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+        tool.forward(document)
+
+        assert len(converter) == 2
+
+
+class TestSliceLines:
+    @pytest.mark.parametrize("text", ["", "a", "a\nb\nc", "a\nb\nc\n", "\n\n"])
+    @pytest.mark.parametrize("start", [0, 1, 2, 3, 5])
+    @pytest.mark.parametrize("limit", [None, 1, 2, 10])
+    def test_matches_split_and_join(self, text, start, limit):
+        lines = text.split("\n")
+        stop = start + limit if limit else None
+        assert _slice_lines(text, start, limit) == "\n".join(lines[start:stop])
@@ -0,0 +1,54 @@
+"""
+Unit tests for the tool registry.
+
+Coverage:
+    - discovery of Tool subclasses by naming convention
+    - class lookup by name
+"""
+
+import pytest
+from smolagents.tools import Tool
+
+from suzent.tools.planning_tool import PlanningTool
+from suzent.tools.registry import (
+    get_tool_class,
+    get_tool_module,
+    get_tool_registry,
+    list_available_tools,
+)
+
+
+class TestDiscovery:
+    def test_finds_tool_subclasses(self):
+        tools = list_available_tools()
+        assert "PlanningTool" in tools
+        assert "WebpageTool" in tools
+
+    def test_skips_base_class(self):
+        assert "Tool" not in list_available_tools()
+
+    def test_declared_tools_are_tool_classes(self):
+        for name in get_tool_registry():
+            cls = get_tool_class(name)
+            assert isinstance(cls, type) and issubclass(cls, Tool), name
+
+    def test_maps_tool_to_module(self):
+        assert get_tool_module("PlanningTool") == "planning_tool"
+
+
+class TestGetToolClass:
+    def test_returns_class(self):
+        cls = get_tool_class("PlanningTool")
+        assert cls is PlanningTool
+        assert issubclass(cls, Tool)
+
+    def test_reuses_resolved_class(self, monkeypatch):
+        get_tool_class("PlanningTool")
+        monkeypatch.setattr(
+            "suzent.tools.registry.get_tool_module",
+            lambda name: pytest.fail("module lookup repeated"),
+        )
+        assert get_tool_class("PlanningTool") is PlanningTool
+
+    def test_unknown_tool(self):
+        assert get_tool_class("NoSuchTool") is None
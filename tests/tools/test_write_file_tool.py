@@ -0,0 +1,103 @@
+"""
+Unit tests for WriteFileTool.
+
+Coverage:
+    - Creating and overwriting files
+    - Byte counts for non-ASCII content
+    - Content written verbatim
+    - Atomic replacement
+"""
+
+import os
+
+import pytest
+
+from suzent.tools import write_file_tool
+from suzent.tools.path_resolver import PathResolver
+from suzent.tools.write_file_tool import WriteFileTool
+
+
+@pytest.fixture
+def session_dir(tmp_path):
+    return (tmp_path / "sandbox-data" / "sessions" / "chat-1").resolve()
+
+
+@pytest.fixture
+def tool(tmp_path):
+    tool = WriteFileTool()
+    tool.set_context(
+        PathResolver(
+            "chat-1",
+            sandbox_enabled=True,
+            sandbox_data_path=str(tmp_path / "sandbox-data"),
+            uploads_path=str(tmp_path / "uploads"),
+            workspace_root=str(tmp_path / "workspace"),
+        )
+    )
+    return tool
+
+
+class TestWriteFile:
+    def test_requires_resolver(self):
+        assert WriteFileTool().forward("a.txt", "x").startswith("Error")
+
+    def test_creates_file_and_parents(self, tool, session_dir):
+        result = tool.forward("/persistence/notes/a.txt", "hello")
+
+        assert result == "Created file: /persistence/notes/a.txt (5 bytes written)"
+        assert (session_dir / "notes" / "a.txt").read_text() == "hello"
+
+    def test_overwrites_existing_file(self, tool, session_dir):
+        tool.forward("a.txt", "first version")
+        result = tool.forward("a.txt", "second")
+
+        assert result.startswith("Overwrote file: a.txt")
+        assert (session_dir / "a.txt").read_text() == "second"
+
+    def test_overwrite_skips_mkdir(self, tool, monkeypatch):
+        tool.forward("notes/a.txt", "first")
+
+        calls = []
+        original = write_file_tool.Path.mkdir
+
+        def counting_mkdir(self, *args, **kwargs):
+            calls.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(write_file_tool.Path, "mkdir", counting_mkdir)
+        tool.forward("notes/a.txt", "second")
+        assert calls == []
+
+    def test_reports_encoded_byte_count(self, tool):
+        assert "(5 bytes written)" in tool.forward("a.txt", "héé")
+
+    def test_writes_content_verbatim(self, tool, session_dir):
+        tool.forward("a.txt", "line1\r\nline2\n")
+        assert (session_dir / "a.txt").read_bytes() == b"line1\r\nline2\n"
+
+    def test_rejects_traversal(self, tool):
+        assert tool.forward("/persistence/../../etc/passwd", "x").startswith("Error")
+
+
+class TestAtomicWrite:
+    def test_failed_write_keeps_original_and_cleans_up(
+        self, tool, session_dir, monkeypatch
+    ):
+        tool.forward("a.txt", "original")
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(write_file_tool.os, "replace", fail)
+        assert tool.forward("a.txt", "new").startswith("Error writing file")
+
+        assert (session_dir / "a.txt").read_text() == "original"
+        # No temp file left behind (uploads/ is created by the resolver)
+        assert sorted(os.listdir(session_dir)) == ["a.txt", "uploads"]
+
+    def test_preserves_mode_of_overwritten_file(self, tool, session_dir):
+        tool.forward("run.sh", "#!/bin/sh")
+        (session_dir / "run.sh").chmod(0o755)
+
+        tool.forward("run.sh", "#!/bin/sh\necho hi")
+        assert (session_dir / "run.sh").stat().st_mode & 0o777 == 0o755